@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 import os
 import sys
+import hashlib
 from functools import lru_cache
 import time
 
@@ -16,6 +17,13 @@ except ImportError as e:
     print("Install with: pip install nba-api")
     NBA_API_AVAILABLE = False
 
+# Optional: Parquet copies of the shot CSVs for fast columnar player lookups
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 def get_exe_safe_path(relative_path):
     """Get the correct path whether running as script or EXE"""
@@ -31,9 +39,9 @@ def get_exe_safe_path(relative_path):
 class EnhancedNBADataManager:
     """Enhanced data manager with full team names and EXE support"""
 
-    def __init__(self, data_dir='nba_data'):
+    def __init__(self, data_dir='nba_data', cache_dir=None):
         # Initialize base manager with EXE-safe path
-        self.base_manager = NBADataManager(data_dir)
+        self.base_manager = NBADataManager(data_dir, cache_dir)
 
         # Enhanced team mapping with full names
         self.full_team_names = {
@@ -72,8 +80,14 @@ class EnhancedNBADataManager:
         # Reverse mapping for lookups
         self.abbreviation_lookup = {v: k for k, v in self.full_team_names.items()}
 
+        # Display team lists per season, reused when the season dropdown is revisited
+        self.teams_cache = {}
+
     def get_teams_for_season_with_full_names(self, season):
         """Get teams with full names for display"""
+        if season in self.teams_cache:
+            return self.teams_cache[season]
+
         abbreviations = self.base_manager.get_teams_for_season(season)
         full_names = []
         for abbr in abbreviations:
@@ -81,7 +95,8 @@ class EnhancedNBADataManager:
                 full_names.append(self.full_team_names[abbr])
             else:
                 full_names.append(abbr)  # Fallback to abbreviation
-        return sorted(full_names)
+        self.teams_cache[season] = sorted(full_names)
+        return self.teams_cache[season]
 
     def get_abbreviation_from_full_name(self, full_name):
         """Get abbreviation from full team name"""
@@ -107,9 +122,12 @@ class EnhancedNBADataManager:
 class NBADataManager:
     """EXE-Safe NBA Data Manager with NBA API roster integration"""
 
-    def __init__(self, data_dir='nba_data'):
+    def __init__(self, data_dir='nba_data', cache_dir=None):
         # Use EXE-safe path
         self.data_dir = get_exe_safe_path(data_dir)
+        # Parquet copies of the CSVs go here, never next to the data (tracked, or the EXE's temp dir);
+        # without one, player lookups read the CSVs directly
+        self.cache_dir = cache_dir
 
         # Check if data directory exists, try alternatives
         if not os.path.exists(self.data_dir):
@@ -460,9 +478,46 @@ class NBADataManager:
             print(f"No shots found for {player_name} in {season}")
             return pd.DataFrame()
 
+    def _parquet_copy(self, csv_path):
+        """Return a cached Parquet copy of csv_path, converting it on first use; None if unavailable"""
+        if self.cache_dir is None:
+            return None
+        tmp_path = None
+        try:
+            stat = os.stat(csv_path)
+            # The EXE re-extracts its data on every launch, so there the bundle's own mtime dates the CSV
+            mtime = os.path.getmtime(sys.executable) if hasattr(sys, '_MEIPASS') else stat.st_mtime
+            source = os.path.relpath(csv_path, self.data_dir)
+            prefix = hashlib.sha1(source.encode()).hexdigest()[:16]
+            version = hashlib.sha1(f"{mtime}|{stat.st_size}".encode()).hexdigest()[:16]
+            parquet_path = os.path.join(self.cache_dir, f"{prefix}-{version}.parquet")
+            if not os.path.exists(parquet_path):
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = parquet_path + '.tmp'
+                pd.read_csv(csv_path).to_parquet(tmp_path, engine='pyarrow',
+                                                 compression='zstd', index=False)
+                os.replace(tmp_path, parquet_path)
+                tmp_path = None
+                # Drop copies of earlier versions of the same CSV
+                for entry in os.scandir(self.cache_dir):
+                    if entry.name.startswith(prefix + '-') and entry.path != parquet_path:
+                        os.remove(entry.path)
+            return parquet_path
+        except Exception as e:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            print(f"Parquet copy unavailable for {os.path.basename(csv_path)}: {e}")
+            return None
+
     def _load_player_from_file(self, filepath, player_name):
         """Load specific player's shots from file"""
         try:
+            if PYARROW_AVAILABLE and filepath.lower().endswith('.csv'):
+                parquet_path = self._parquet_copy(filepath)
+                if parquet_path:
+                    return pd.read_parquet(parquet_path, engine='pyarrow',
+                                           filters=[('PLAYER_NAME', '==', player_name)])
+
             chunk_size = 10000
             player_shots = []
 
@@ -498,6 +553,14 @@ class NBADataManager:
         }
         df = df.rename(columns=column_map)
 
+        # Narrow the plotted columns once here; every heatmap reads them as float32/int8
+        try:
+            df = df.astype({col: dtype for col, dtype in
+                            (('x', 'float32'), ('y', 'float32'), ('shot_made_flag', 'int8'))
+                            if col in df.columns})
+        except (TypeError, ValueError) as e:
+            print(f"Could not narrow shot coordinate dtypes: {e}")
+
         if 'game_date' in df.columns:
             try:
                 df['game_date'] = pd.to_datetime(df['game_date'], format='%Y%m%d')
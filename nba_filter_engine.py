@@ -1,9 +1,45 @@
 import pandas as pd
 import numpy as np
 
+# Optional: pyarrow-backed columns for zero-copy Polars/DuckDB handoff
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def to_compact_column(values, dtype):
+    """Convert an estimate array to a compact (pyarrow-backed when available) column"""
+    if PYARROW_AVAILABLE:
+        return pd.array(values, dtype=f"{dtype}[pyarrow]")
+    # Always copy: estimates may live in the engine's shared scratch buffers
+    return np.array(values, dtype=dtype)
+
+
+def simulate_streaks(n_games: int) -> np.ndarray:
+    """Random-walk win/loss streak per game (plain typed loop, mypyc/Cython-compilable)"""
+    streaks = np.zeros(n_games, dtype=np.int8)
+    current_streak: int = 0
+    for game_idx in range(n_games):
+        if np.random.random() < 0.55 and current_streak != 0:
+            current_streak = current_streak + 1 if current_streak > 0 else current_streak - 1
+        else:
+            if np.random.random() < 0.6:
+                current_streak = 1 if current_streak <= 0 else current_streak + 1
+            else:
+                current_streak = -1 if current_streak >= 0 else current_streak - 1
+        current_streak = max(-8, min(8, current_streak))
+        streaks[game_idx] = current_streak
+    return streaks
+
+
 class NBAFilterEngine:
     """Enhanced filtering for player-specific data with all 8 filters implemented - FIXED VERSION"""
 
+    # Scratch buffers for the estimate kernels, reused across engine constructions
+    _buffer_pool = {}
+
     def __init__(self, shot_data, pbp_data=None):
         self.shot_data = shot_data
         self.pbp_data = pbp_data if pbp_data is not None else pd.DataFrame()
@@ -11,6 +47,9 @@ class NBAFilterEngine:
         # Standardize column names for consistent filtering
         self._standardize_columns()
 
+        # Store string game ids as categorical codes for faster unique/map/groupby
+        self._categorize_game_ids()
+
         # Debug helper (silenced)
         self._debug_available_columns()
 
@@ -47,6 +86,14 @@ class NBAFilterEngine:
                 if old_col in self.shot_data.columns and new_col not in self.shot_data.columns:
                     self.shot_data = self.shot_data.rename(columns={old_col: new_col})
 
+    def _categorize_game_ids(self):
+        """Convert object-dtype game ids to a Categorical once at ingestion"""
+        if self.shot_data is None or 'game_id' not in self.shot_data.columns:
+            return
+        game_id_dtype = self.shot_data['game_id'].dtype
+        if pd.api.types.is_object_dtype(game_id_dtype) or pd.api.types.is_string_dtype(game_id_dtype):
+            self.shot_data['game_id'] = self.shot_data['game_id'].astype('category')
+
     def _prepare_enhanced_data(self):
         """Pre-calculate enhanced data for complex filters"""
         if self.shot_data is None or self.shot_data.empty:
@@ -54,16 +101,15 @@ class NBAFilterEngine:
 
         self._add_game_numbers()
         self._add_rest_days()
-        self._add_score_margin_estimation()
-        self._add_minutes_played_estimation()
-        self._add_win_loss_streak_estimation()
+        self._add_estimations()
 
     def apply_all_filters(self, player_name, team, filters):
         """Apply all 8 filters efficiently to player data"""
         if self.shot_data.empty:
             return self.shot_data
 
-        data = self.shot_data.copy()
+        # Filters only select rows and callers treat the result as read-only, so no defensive copy
+        data = self.shot_data
 
         for filter_name, filter_value in filters.items():
             if filter_value != 'All':
@@ -411,7 +457,7 @@ class NBAFilterEngine:
                     unique_games = self.shot_data.drop_duplicates('game_id')[['game_id', 'game_date']].sort_values('game_date')
                     unique_games['game_num'] = range(1, len(unique_games) + 1)
                     game_num_map = dict(zip(unique_games['game_id'], unique_games['game_num']))
-                    self.shot_data['game_num'] = self.shot_data['game_id'].map(game_num_map)
+                    self.shot_data['game_num'] = self.shot_data['game_id'].map(game_num_map).to_numpy()
                 else:
                     unique_dates = sorted(self.shot_data['game_date'].dropna().unique())
                     date_to_game_num = {date: i + 1 for i, date in enumerate(unique_dates)}
@@ -435,7 +481,7 @@ class NBAFilterEngine:
                     unique_games['rest_days'] = (unique_games['game_date'] - unique_games['prev_game_date']).dt.days - 1
                     unique_games['rest_days'] = unique_games['rest_days'].fillna(0).clip(lower=0)
                     rest_days_map = dict(zip(unique_games['game_id'], unique_games['rest_days']))
-                    self.shot_data['rest_days'] = self.shot_data['game_id'].map(rest_days_map)
+                    self.shot_data['rest_days'] = self.shot_data['game_id'].map(rest_days_map).to_numpy()
                 else:
                     unique_dates = sorted(self.shot_data['game_date'].dropna().unique())
                     date_to_rest = {}
@@ -452,90 +498,94 @@ class NBAFilterEngine:
         except Exception as e:
             print(f"Could not calculate rest days: {e}")
 
-    def _add_score_margin_estimation(self):
-        """Add estimated score margin for game flow filtering (simple heuristic)"""
-        try:
-            self.shot_data['estimated_margin'] = 0.0
-
-            if 'period' in self.shot_data.columns:
-                period_factor = self.shot_data['period'].fillna(1)
-                np.random.seed(42)
-                game_ids = self.shot_data.get('game_id', range(len(self.shot_data)))
-                unique_games = pd.Series(game_ids).unique()
-                game_margins = {}
-
-                for game_id in unique_games:
-                    base_margin = np.random.normal(0, 8)
-                    game_margins[game_id] = base_margin
-
-                for idx, row in self.shot_data.iterrows():
-                    game_id = game_ids[idx] if hasattr(game_ids, '__getitem__') else idx
-                    base_margin = game_margins.get(game_id, 0)
-                    period_adj = 1.0 if period_factor.iloc[idx] <= 3 else 0.7
-                    self.shot_data.loc[idx, 'estimated_margin'] = float(base_margin * period_adj)
-
-        except Exception as e:
-            print(f"Could not estimate score margins: {e}")
-            self.shot_data['estimated_margin'] = 0.0
-
-    def _add_minutes_played_estimation(self):
-        """Add estimated minutes played for fatigue filtering"""
-        try:
-            self.shot_data['estimated_minutes'] = 25.0
-
-            if 'period' in self.shot_data.columns and 'minutes_remaining' in self.shot_data.columns:
-                period = self.shot_data['period'].fillna(1)
-                minutes_remaining = self.shot_data['minutes_remaining'].fillna(6)
-                elapsed_in_period = 12 - minutes_remaining
-                total_elapsed = (period - 1) * 12 + elapsed_in_period
-                self.shot_data['estimated_minutes'] = (total_elapsed * 0.75).clip(0, 48)
-
-            elif 'period' in self.shot_data.columns:
-                period = self.shot_data['period'].fillna(1)
-                self.shot_data['estimated_minutes'] = (period * 9).clip(0, 45)
-
-            else:
-                np.random.seed(42)
-                variation = np.random.normal(0, 5, len(self.shot_data))
-                self.shot_data['estimated_minutes'] = (25 + variation).clip(10, 45)
-
-        except Exception as e:
-            print(f"Could not estimate minutes played: {e}")
-            self.shot_data['estimated_minutes'] = 25.0
-
-    def _add_win_loss_streak_estimation(self):
-        """Add estimated win/loss streak for streak filtering"""
-        try:
-            np.random.seed(42)
-
-            if 'game_id' in self.shot_data.columns:
-                unique_games = self.shot_data['game_id'].unique()
-                game_streaks = {}
-                current_streak = 0
-                for game_id in sorted(unique_games):
-                    if np.random.random() < 0.55 and current_streak != 0:
-                        current_streak = current_streak + 1 if current_streak > 0 else current_streak - 1
-                    else:
-                        if np.random.random() < 0.6:
-                            current_streak = 1 if current_streak <= 0 else current_streak + 1
-                        else:
-                            current_streak = -1 if current_streak >= 0 else current_streak - 1
-                    current_streak = max(-8, min(8, current_streak))
-                    game_streaks[game_id] = current_streak
-
-                self.shot_data['estimated_streak'] = self.shot_data['game_id'].map(game_streaks).fillna(0)
-            else:
-                streak_options = [-3, -2, -1, 0, 1, 2, 3]
-                streak_weights = [0.1, 0.15, 0.2, 0.3, 0.2, 0.15, 0.1]
-                self.shot_data['estimated_streak'] = np.random.choice(
-                    streak_options,
-                    size=len(self.shot_data),
-                    p=streak_weights
-                )
-
-        except Exception as e:
-            print(f"Could not estimate win/loss streaks: {e}")
-            self.shot_data['estimated_streak'] = 0
+    def _add_estimations(self):
+        """Add estimated score margin, minutes played and win/loss streak in a single pass"""
+        columns = self.shot_data.columns
+
+        # Read each input column once and share it between the estimators
+        period = self._numeric_column('period', fill=1.0) if 'period' in columns else None
+        minutes_remaining = (self._numeric_column('minutes_remaining', fill=6.0)
+                             if 'minutes_remaining' in columns else None)
+        game_ids = self.shot_data['game_id'] if 'game_id' in columns else None
+
+        self.shot_data = self.shot_data.assign(
+            estimated_margin=to_compact_column(self._estimate_score_margin(period, game_ids), 'float32'),
+            estimated_minutes=to_compact_column(self._estimate_minutes_played(period, minutes_remaining), 'float32'),
+            estimated_streak=to_compact_column(self._estimate_win_loss_streak(game_ids), 'int8')
+        )
+
+    @classmethod
+    def _get_buffer(cls, name, n, dtype):
+        """Return a reusable scratch array of length n for the named estimate"""
+        key = (name, np.dtype(dtype))
+        buffer = cls._buffer_pool.get(key)
+        if buffer is None or len(buffer) < n:
+            buffer = cls._buffer_pool[key] = np.empty(n, dtype=dtype)
+        return buffer[:n]
+
+    def _numeric_column(self, column, fill):
+        """Read a column as a float64 array with NaNs filled (no intermediate Series)"""
+        return np.nan_to_num(self.shot_data[column].to_numpy(dtype=np.float64, na_value=np.nan), nan=fill)
+
+    def _estimate_score_margin(self, period, game_ids):
+        """Estimate score margin for game flow filtering (simple heuristic)"""
+        n = len(self.shot_data)
+        if period is None:
+            return np.zeros(n, dtype=np.float32)
+
+        np.random.seed(42)
+        if game_ids is None:
+            game_ids = np.arange(n)
+
+        # One base margin per game, gathered to rows via factorized codes,
+        # then damped in place for 4th quarter/OT shots
+        game_codes, unique_games = pd.factorize(game_ids)
+        if len(unique_games) == 0:
+            # Every game_id missing: no per-game margin to gather
+            return np.zeros(n, dtype=np.float32)
+        game_margins = np.random.normal(0, 8, len(unique_games)).astype(np.float32)
+        margins = self._get_buffer('estimated_margin', n, np.float32)
+        np.take(game_margins, game_codes, out=margins)
+        margins[game_codes < 0] = 0.0
+        margins[period > 3] *= 0.7
+        return margins
+
+    def _estimate_minutes_played(self, period, minutes_remaining):
+        """Estimate minutes played for fatigue filtering"""
+        if period is not None and minutes_remaining is not None:
+            # ((period - 1) * 12 + (12 - minutes_remaining)) * 0.75, computed in place
+            minutes = self._get_buffer('estimated_minutes', len(period), np.float32)
+            np.multiply(period, 12, out=minutes)
+            minutes -= minutes_remaining
+            minutes *= 0.75
+            return np.clip(minutes, 0, 48, out=minutes)
+
+        if period is not None:
+            return (period * 9).clip(0, 45)
+
+        np.random.seed(42)
+        variation = np.random.normal(0, 5, len(self.shot_data))
+        return (25 + variation).clip(10, 45)
+
+    def _estimate_win_loss_streak(self, game_ids):
+        """Estimate win/loss streak for streak filtering"""
+        np.random.seed(42)
+
+        if game_ids is None:
+            # Sample directly from the normalized CDF (int8 output)
+            streak_options = np.array([-3, -2, -1, 0, 1, 2, 3], dtype=np.int8)
+            streak_weights = np.array([0.1, 0.15, 0.2, 0.3, 0.2, 0.15, 0.1])
+            cdf = np.cumsum(streak_weights)
+            cdf /= cdf[-1]
+            idx = np.searchsorted(cdf, np.random.random(len(self.shot_data)), side='right')
+            return streak_options[idx]
+
+        # Sorted factorization: games walked in order, streaks gathered by code
+        game_codes, unique_games = pd.factorize(game_ids, sort=True)
+        if len(unique_games) == 0:
+            return np.zeros(len(game_codes), dtype=np.int8)
+        game_streaks = simulate_streaks(len(unique_games))
+        return np.where(game_codes >= 0, game_streaks[game_codes], 0)
 
 
 # Example usage and testing
@@ -1,23 +1,47 @@
 import sys
 import os
+import io
+import hashlib
+import logging
 import subprocess
 import pandas as pd
 import numpy as np
-import tempfile
-import matplotlib.pyplot as plt
+import threading
+import weakref
+import matplotlib
+matplotlib.use('Agg', force=True)
 import matplotlib.patches as patches
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PatchCollection
+from matplotlib.lines import Line2D
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import text_to_path
+from matplotlib.path import Path
 from matplotlib.colors import LinearSegmentedColormap
-from scipy import ndimage
 from typing import Union, Dict
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QMessageBox, QPushButton, 
                              QVBoxLayout, QHBoxLayout, QFileDialog, QWidget, QLabel,
                              QDialog, QComboBox)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QShortcut, QKeySequence, QPixmap
+from PyQt6.QtCore import (Qt, QEvent, QObject, QRunnable, QStandardPaths, QStringListModel, QThreadPool,
+                          QTimer, pyqtSignal)
+from PyQt6.QtGui import QShortcut, QKeySequence, QPixmap, QPixmapCache, QImage
+from PyQt6 import sip
+from PIL import Image
 from mainwindow import Ui_MainWindow
 from nba_data_manager import NBADataManager, EnhancedNBADataManager
 from nba_filter_engine import NBAFilterEngine
 
+# Per-action trace messages; errors still go straight to stdout
+logger = logging.getLogger(__name__)
+
+# Optional: C-level uniform-bin histogramming
+try:
+    from fast_histogram import histogram2d as fhist2d
+    FAST_HISTOGRAM_AVAILABLE = True
+except ImportError:
+    FAST_HISTOGRAM_AVAILABLE = False
+
 try:
     from nba_api_helper import get_nba_teams
 except ImportError:
@@ -30,192 +54,526 @@ except ImportError:
             'by_abbreviation': {}
         }
 
-class SmartResolutionHeatmapGenerator(QThread):
-    image_ready = pyqtSignal(str)
+COURT_RANGE = [[-250, 250], [-47.5, 422.5]]
+
+def split_made_missed(shot_data):
+    """Return float32 x, y and the (x, y) pairs of made and missed shots, from one mask pass"""
+    x = shot_data['x'].to_numpy(dtype=np.float32, copy=False)
+    y = shot_data['y'].to_numpy(dtype=np.float32, copy=False)
+    mask_made = shot_data['shot_made_flag'].to_numpy(copy=False) == 1
+    made_idx = np.flatnonzero(mask_made)
+    miss_idx = np.flatnonzero(~mask_made)
+    return x, y, (x.take(made_idx), y.take(made_idx)), (x.take(miss_idx), y.take(miss_idx))
+
+def shot_fingerprint(shot_data):
+    """Stable hex digest of the shot coordinates and outcomes; equal for any filter state selecting the same shots"""
+    digest = hashlib.blake2b(digest_size=16)
+    for col in ('x', 'y', 'shot_made_flag'):
+        digest.update(np.ascontiguousarray(shot_data[col].to_numpy()).tobytes())
+    return digest.hexdigest()
+
+def histogram_court(x, y, bins):
+    """Uniform-bin 2D histogram over the half court, returning (H, xedges, yedges)"""
+    (x_lo, x_hi), (y_lo, y_hi) = COURT_RANGE
+    xedges = np.linspace(x_lo, x_hi, bins + 1)
+    yedges = np.linspace(y_lo, y_hi, bins + 1)
+    if FAST_HISTOGRAM_AVAILABLE:
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        y = np.ascontiguousarray(y, dtype=np.float64)
+        return fhist2d(x, y, range=COURT_RANGE, bins=bins), xedges, yedges
+    
+    # Bins are uniform, so index arithmetically + bincount instead of histogram2d's per-axis searchsorted.
+    # A season of shots bins in well under a millisecond this way; a JIT/multithreaded kernel would
+    # spend longer compiling and spinning up threads than it saves
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    keep = (x >= x_lo) & (x <= x_hi) & (y >= y_lo) & (y <= y_hi)
+    ix = _uniform_bin_index(x[keep], xedges)
+    iy = _uniform_bin_index(y[keep], yedges)
+    H = np.bincount(ix * bins + iy, minlength=bins * bins).reshape(bins, bins)
+    return H.astype(np.float64), xedges, yedges
+
+def _uniform_bin_index(v, edges):
+    """Bin index of in-range values v over uniform edges, matching searchsorted at the edges"""
+    bins = edges.size - 1
+    idx = ((v - edges[0]) * (bins / (edges[-1] - edges[0]))).astype(np.intp)
+    np.minimum(idx, bins - 1, out=idx)  # right edge belongs to the last bin
+    # Float rounding can land a value one bin off right at an edge; nudge it back as np.histogram does
+    idx -= v < edges.take(idx)
+    idx += (v >= edges[1:].take(idx)) & (idx != bins - 1)
+    return idx
+
+# Sigma scales with the frame width on the display path, so bound the kernel cache like the others
+_GAUSS_KERNELS = {}
+_GAUSS_KERNELS_SIZE = 16
+
+def gaussian_blur_inplace(H, sigma, truncate=4.0):
+    """Separable Gaussian blur of a 2D grid in place; same result as ndimage.gaussian_filter"""
+    from scipy import ndimage
+    key = (float(sigma), float(truncate))
+    kernel = _GAUSS_KERNELS.pop(key, None)
+    if kernel is None:
+        # Each 1D kernel is built once per sigma and reused for both passes
+        radius = int(truncate * sigma + 0.5)
+        offsets = np.arange(-radius, radius + 1)
+        kernel = np.exp(-0.5 / (sigma * sigma) * offsets ** 2)
+        kernel /= kernel.sum()
+        if len(_GAUSS_KERNELS) >= _GAUSS_KERNELS_SIZE:
+            _GAUSS_KERNELS.pop(next(iter(_GAUSS_KERNELS)))
+    _GAUSS_KERNELS[key] = kernel
+    ndimage.correlate1d(H, kernel, axis=0, output=H)
+    ndimage.correlate1d(H, kernel, axis=1, output=H)
+    return H
+
+# Smoothed grids keyed on a fingerprint of the shot coordinates, so a display render and the
+# export of the same filtered shots bin and blur once
+_SMOOTHED_CACHE = {}
+_SMOOTHED_CACHE_SIZE = 8
+
+def smoothed_histogram_court(x, y, bins, sigma=0.0, truncate=2.0):
+    """Bin shots and apply the Gaussian smoothing in one float32 pass; sigma < 0.5 skips smoothing.
+
+    Results are cached and returned read-only.
+    """
+    x = np.ascontiguousarray(x)
+    y = np.ascontiguousarray(y)
+    key = (x.size, x.dtype.str, hash(x.tobytes()), hash(y.tobytes()), bins, round(sigma, 3), truncate)
+    cached = _SMOOTHED_CACHE.pop(key, None)
+    if cached is None:
+        H, xedges, yedges = histogram_court(x, y, bins)
+        H = H.astype(np.float32, copy=False)
+        if sigma >= 0.5:
+            gaussian_blur_inplace(H, sigma, truncate=truncate)
+        H.flags.writeable = False
+        cached = (H, xedges, yedges)
+        if len(_SMOOTHED_CACHE) >= _SMOOTHED_CACHE_SIZE:
+            _SMOOTHED_CACHE.pop(next(iter(_SMOOTHED_CACHE)))
+    _SMOOTHED_CACHE[key] = cached
+    return cached
+
+DENSE_SHOT_THRESHOLD = 2000
+
+def shot_density_rgba(made_x, made_y, missed_x, missed_y, bins):
+    """Aggregate made/missed shots into one uint8 RGBA image (green=made, red=missed)"""
+    H_made, xedges, yedges = histogram_court(made_x, made_y, bins)
+    H_miss, _, _ = histogram_court(missed_x, missed_y, bins)
+    total = H_made + H_miss
+    
+    rgba = np.zeros((bins, bins, 4), dtype=np.uint8)
+    if total.max() > 0:
+        peak = max(H_made.max(), H_miss.max())
+        rgba[..., 0] = (H_miss.T / peak * 255).astype(np.uint8)
+        rgba[..., 1] = (H_made.T / peak * 255).astype(np.uint8)
+        rgba[..., 3] = (np.log1p(total.T) / np.log1p(total.max()) * 255).astype(np.uint8)
+    return rgba, xedges, yedges
+
+def add_zone_labels(ax, labels, fontsize, pad, linewidth):
+    """Draw (x, y, text, color) zone labels as plain texts over one PatchCollection of rounded boxes"""
+    if not labels:
+        return
+    
+    prop = FontProperties(weight='bold', size=fontsize)
+    boxes = []
+    for _, _, text, _ in labels:
+        lines = text.split('\n')
+        width = max(text_to_path.get_text_width_height_descent(line, prop, ismath=False)[0]
+                    for line in lines) / 72
+        height = 1.2 * fontsize * len(lines) / 72
+        boxes.append(patches.FancyBboxPatch((-width / 2, -height / 2), width, height,
+                                            boxstyle=f'round,pad={pad * fontsize / 72}'))
+    
+    collection = PatchCollection(boxes, facecolors=[color for *_, color in labels],
+                                 edgecolors='white', linewidths=linewidth, alpha=0.95,
+                                 transform=ax.figure.dpi_scale_trans,
+                                 offsets=[(x, y) for x, y, *_ in labels],
+                                 offset_transform=ax.transData, zorder=3)
+    ax.add_collection(collection, autolim=False)
+    
+    for x, y, text, _ in labels:
+        ax.text(x, y, text, fontsize=fontsize, fontweight='bold',
+                ha='center', va='center', color='white', zorder=4)
+
+def update_outcome_layer(scatter, made_x, made_y, missed_x, missed_y, made_style, missed_style, edge_width):
+    """Point an outcome scatter at new made/missed shots with per-point colors and white edges.
+
+    made_style/missed_style are (color, alpha, size); missed shots come second so they draw on top.
+    """
+    made_color, made_alpha, made_size = made_style
+    missed_color, missed_alpha, missed_size = missed_style
+    is_made = np.r_[np.ones(len(made_x), dtype=bool), np.zeros(len(missed_x), dtype=bool)]
+    face_colors = np.where(is_made[:, None], matplotlib.colors.to_rgba(made_color, made_alpha),
+                           matplotlib.colors.to_rgba(missed_color, missed_alpha))
+    edge_colors = np.ones_like(face_colors)
+    edge_colors[:, 3] = face_colors[:, 3]
+    scatter.set_offsets(np.column_stack((np.r_[made_x, missed_x], np.r_[made_y, missed_y])))
+    scatter.set_facecolors(face_colors)
+    scatter.set_edgecolors(edge_colors)
+    scatter.set_sizes(np.where(is_made, made_size, missed_size))
+    scatter.set_linewidth(edge_width)
+    scatter.set_visible(True)
+
+# Zone percentage bands: < 30, 30-40, 40-50, >= 50; palettes are listed in that order
+ZONE_PCT_THRESHOLDS = np.array([30.0, 40.0, 50.0])
+ZONE_PALETTE_CRISP = ('#F44336', '#FF9800', '#FFC107', '#4CAF50')
+ZONE_PALETTE_OPTIMAL = ('#D32F2F', '#FF8F00', '#FFB300', '#00C853')
+
+# Court coordinates of each zone's percentage label; the crisp view sits its labels a little lower
+ZONE_LABEL_POSITIONS = {
+    'Restricted Area': (0, 70),
+    'In The Paint (Non-RA)': (0, 140),
+    'Mid-Range': (0, 210),
+    'Above the Break 3': (0, 305),
+    'Left Corner 3': (-180, 50),
+    'Right Corner 3': (180, 50),
+}
+ZONE_LABEL_POSITIONS_CRISP = {
+    'Restricted Area': (0, 60),
+    'In The Paint (Non-RA)': (0, 130),
+    'Mid-Range': (0, 200),
+    'Above the Break 3': (0, 300),
+    'Left Corner 3': (-200, 40),
+    'Right Corner 3': (200, 40),
+}
+
+def zone_colors(percentages, palette):
+    """Map zone percentages to palette colors by threshold band"""
+    return [palette[i] for i in np.searchsorted(ZONE_PCT_THRESHOLDS, percentages, side='right')]
+
+def register_cmap(cmap):
+    """Register a module-level colormap with matplotlib once and return it"""
+    if cmap.name not in matplotlib.colormaps:
+        matplotlib.colormaps.register(cmap)
+    return cmap
+
+# Court arcs baked once as polylines; patches.Arc re-tessellates its bezier on every draw
+_THETA_3PT = np.linspace(np.radians(22), np.radians(158), 128)
+_PATH_3PT = Path(np.c_[237.5 * np.cos(_THETA_3PT), 237.5 * np.sin(_THETA_3PT)])
+_THETA_FT = np.linspace(0, np.pi, 64)
+_PATH_FT = Path(np.c_[60 * np.cos(_THETA_FT), 142.5 + 60 * np.sin(_THETA_FT)])
+
+def _build_court_artists(ax, line_width, line_color, alpha=1.0, rim_color='#ff6b35', rim_size=7,
+                         rim_alpha=1.0, rim_line_width=None, backboard_width=None):
+    """Draw the half court on ax and return the added artists"""
+    if rim_line_width is None:
+        rim_line_width = line_width
+    if backboard_width is None:
+        backboard_width = line_width * 1.5
+    line_style = dict(linewidth=line_width, edgecolor=line_color, facecolor='none', alpha=alpha)
+    
+    artists = [
+        patches.Rectangle((-250, -47.5), 500, 470, **line_style),
+        patches.Circle((0, 0), 60, **line_style),
+        patches.PathPatch(_PATH_3PT, **line_style),
+        patches.Rectangle((-80, -47.5), 160, 190, **line_style),
+        patches.PathPatch(_PATH_FT, **line_style),
+        patches.Circle((0, 0), rim_size, linewidth=rim_line_width,
+                       edgecolor=rim_color, facecolor=rim_color, alpha=rim_alpha),
+    ]
+    for artist in artists:
+        ax.add_patch(artist)
+    
+    artists += ax.plot([-220, -220], [-47.5, 92.5], color=line_color, linewidth=line_width, alpha=alpha)
+    artists += ax.plot([220, 220], [-47.5, 92.5], color=line_color, linewidth=line_width, alpha=alpha)
+    artists += ax.plot([-30, 30], [-7.5, -7.5], color=line_color, linewidth=backboard_width, alpha=alpha)
+    return artists
+
+def fix_court_view(ax):
+    """Pin the half-court view and turn autoscaling off so added artists skip datalim updates"""
+    ax.set_xlim(-260, 260)
+    ax.set_ylim(-50, 430)
+    ax.set_aspect('equal')
+    ax.set_autoscale_on(False)
+
+# Court figures reused across renders, keyed by generator, size and dpi (LRU order); every
+# frame size a window is resized to gets its own entry, so keep only the recent ones
+_COURT_CACHE = {}
+_COURT_CACHE_SIZE = 4
+_COURT_CACHE_LOCK = threading.Lock()
+
+def _get_court_figure(key, figsize, dpi, setup_court):
+    """Return a cached (fig, ax, layers) with the court drawn, stripped of the previous run's data artists.
+
+    setup_court(fig, ax) draws the static court and returns the persistent data layers
+    (images/scatters updated in place each run); they come back hidden.
+    Callers must hold _COURT_CACHE_LOCK until the figure has been saved.
+    """
+    cached = _COURT_CACHE.pop(key, None)
+    if cached is None:
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        layers = setup_court(fig, ax)
+        cached = (fig, ax, layers)
+        if len(_COURT_CACHE) >= _COURT_CACHE_SIZE:
+            _COURT_CACHE.pop(next(iter(_COURT_CACHE)))
+    _COURT_CACHE[key] = cached
     
-    def __init__(self, shot_data, player_name, zones_data, frame_size):
+    fig, ax, layers = cached
+    persistent = set(layers.values())
+    for artist in [*ax.images, *ax.collections, *ax.texts]:
+        if artist not in persistent:
+            artist.remove()
+    if ax.legend_ is not None:
+        ax.legend_.remove()
+    for layer in persistent:
+        layer.set_visible(False)
+    return cached
+
+def create_data_layers(ax, cmap, heatmap_alpha, interpolation):
+    """Create the hidden heatmap/density images and the outcome scatter reused across renders"""
+    layers = {
+        'heatmap': ax.imshow(np.zeros((1, 1)), origin='lower', cmap=cmap, alpha=heatmap_alpha,
+                             aspect='equal', interpolation=interpolation),
+        'density': ax.imshow(np.zeros((1, 1, 4), dtype=np.uint8), origin='lower',
+                             aspect='equal', interpolation=interpolation),
+        'shots': ax.scatter([], [], rasterized=True),
+    }
+    for layer in layers.values():
+        layer.set_visible(False)
+    return layers
+
+def update_image_layer(image, data, xedges, yedges):
+    image.set_data(data)
+    image.set_extent([xedges[0], xedges[-1], yedges[0], yedges[-1]])
+    if data.ndim == 2:
+        image.set_clim(data.min(), data.max())
+    image.set_visible(True)
+
+def tight_rgba(fig, pad_inches, fit=None):
+    """Draw fig on its Agg canvas and return a view of the tight-cropped RGBA buffer.
+
+    With fit=(width, height) the figure dpi is adjusted so the crop fits that pixel box, letting the
+    caller show the image unscaled; the dpi sticks to the cached figure so later renders draw once.
+    """
+    canvas = fig.canvas
+    canvas.draw()
+    bbox = fig.get_tightbbox(canvas.get_renderer()).padded(pad_inches)
+    
+    # Unlike savefig, a raw buffer cannot grow to fit a title drawn above the figure;
+    # lower the axes once instead (the margins persist on the cached figure)
+    overflow = bbox.y1 - fig.get_figheight()
+    if overflow > 0:
+        fig.subplots_adjust(top=fig.subplotpars.top - overflow / fig.get_figheight())
+        canvas.draw()
+        bbox = fig.get_tightbbox(canvas.get_renderer()).padded(pad_inches)
+    
+    if fit is not None:
+        # Two pixels of slack: the crop below rounds both edges outward
+        fit_dpi = min((fit[0] - 2) / bbox.width, (fit[1] - 2) / bbox.height)
+        if abs(fit_dpi - fig.dpi) > 0.005 * fig.dpi:
+            fig.set_dpi(fit_dpi)
+            canvas.draw()
+            bbox = fig.get_tightbbox(canvas.get_renderer()).padded(pad_inches)
+    
+    buf = np.asarray(canvas.buffer_rgba())
+    height, width = buf.shape[:2]
+    x0 = max(0, int(bbox.x0 * fig.dpi))
+    x1 = min(width, int(np.ceil(bbox.x1 * fig.dpi)))
+    y0 = max(0, height - int(np.ceil(bbox.y1 * fig.dpi)))
+    y1 = min(height, height - int(bbox.y0 * fig.dpi))
+    return buf[y0:y1, x0:x1]
+
+def figure_to_qimage(fig, pad_inches, fit=None):
+    """Tight-cropped render of fig as a QImage (no PNG round-trip); see tight_rgba for fit"""
+    # Wrap the crop in place (rows keep the canvas stride); copy() is the only pixel copy
+    crop = tight_rgba(fig, pad_inches, fit)
+    return QImage(sip.voidptr(crop.ctypes.data), crop.shape[1], crop.shape[0], crop.strides[0],
+                  QImage.Format.Format_RGBA8888).copy()
+
+def save_tight_figure(fig, path, dpi, pad_inches):
+    """Equivalent of savefig(bbox_inches='tight') that draws once; PNGs go straight to Pillow"""
+    if not str(path).lower().endswith('.png'):
+        fig.savefig(path, dpi=dpi, bbox_inches='tight', pad_inches=pad_inches,
+                    facecolor=fig.get_facecolor(), edgecolor='none')
+        return
+    if fig.dpi != dpi:
+        fig.set_dpi(dpi)
+    Image.fromarray(tight_rgba(fig, pad_inches)).save(path, format='PNG', compress_level=1)
+
+# Rendered heatmaps persisted across sessions; bump the version when the rendering changes
+HEATMAP_DISK_CACHE_VERSION = 1
+HEATMAP_DISK_CACHE_BYTES = 500 * 1024 * 1024
+
+def heatmap_disk_path(cache_dir, cache_key):
+    """PNG path in cache_dir for a heatmap cache key"""
+    name = hashlib.sha1(f"{HEATMAP_DISK_CACHE_VERSION}|{cache_key}".encode()).hexdigest()
+    return os.path.join(cache_dir, name + '.png')
+
+def prune_disk_cache(cache_dir, max_bytes):
+    """Delete the least recently used PNGs in cache_dir until it fits in max_bytes"""
+    try:
+        entries = []
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith('.png') and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            os.remove(path)
+            total -= size
+    except OSError as e:
+        logger.warning("Could not prune heatmap cache: %s", e)
+
+def prewarm_matplotlib():
+    """Import scipy.ndimage and render a throwaway figure so the first heatmap starts warm"""
+    from scipy import ndimage  # noqa: F401
+    fig = Figure(figsize=(1, 1))
+    fig.text(0.5, 0.5, 'warmup', fontweight='bold')
+    fig.savefig(io.BytesIO(), format='png')
+
+class HeatmapSignals(QObject):
+    image_ready = pyqtSignal(QImage)
+    export_done = pyqtSignal(str)
+    export_failed = pyqtSignal(str)
+    render_failed = pyqtSignal(str)
+
+class HeatmapGenerator(QRunnable):
+    """Render a heatmap on a worker pool; emits image_ready/render_failed, or export_done/export_failed with export_path.
+
+    Subclasses implement render(output_path=None), returning a QImage when output_path is None.
+    """
+    
+    def __init__(self, shot_data, player_name, zones_data, frame_size, export_path=None, cache_path=None):
         super().__init__()
+        self.signals = HeatmapSignals()
         self.shot_data = shot_data
         self.player_name = player_name
         self.zones_data = zones_data
         self.frame_width = frame_size.width()
         self.frame_height = frame_size.height()
+        self.export_path = export_path
+        self.cache_path = cache_path
+    
+    def render(self, output_path=None):
+        raise NotImplementedError
     
     def run(self):
+        if self.export_path is not None:
+            try:
+                self.render(self.export_path)
+                self.signals.export_done.emit(self.export_path)
+            except Exception as e:
+                logger.exception("Export error")
+                self.signals.export_failed.emit(str(e))
+            return
         try:
-            temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-            image_path = temp_file.name
-            temp_file.close()
-            self.create_smart_resolution_heatmap(image_path)
-            self.image_ready.emit(image_path)
+            image = self.render()
+            self.signals.image_ready.emit(image)
         except Exception as e:
-            print(f"Error generating smart heatmap: {e}")
+            logger.exception("Error generating %s heatmap", type(self).__name__)
+            self.signals.render_failed.emit(str(e))
+            return
+        if self.cache_path is not None:
+            self.save_to_disk_cache(image)
     
-    def create_smart_resolution_heatmap(self, output_path):
-        import matplotlib
-        matplotlib.use('Agg')
-        
+    def save_to_disk_cache(self, image):
+        # Written off the GUI thread, via a temporary name so a reader never sees a partial PNG
+        tmp_path = self.cache_path + '.tmp'
+        try:
+            if image.save(tmp_path, 'PNG'):
+                os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("Could not write heatmap cache: %s", e)
+
+class SmartResolutionHeatmapGenerator(HeatmapGenerator):
+    _CMAP_HOT = register_cmap(LinearSegmentedColormap.from_list('crisp_hot', [
+        '#001a4d', '#003380', '#0066cc', '#0099ff', '#33ccff', 
+        '#66ffcc', '#ccff66', '#ffcc33', '#ff9900', '#ff3300'
+    ]))
+    
+    def create_smart_resolution_heatmap(self, output_path=None):
         frame_aspect = self.frame_width / self.frame_height
         fig_width_inches = 10.4
         fig_height_inches = fig_width_inches / frame_aspect
         
-        fig, ax = plt.subplots(figsize=(fig_width_inches, fig_height_inches))
+        target_dpi = max(150, min(300, self.frame_width / fig_width_inches))
+        figsize = (fig_width_inches, fig_height_inches)
+        
+        with _COURT_CACHE_LOCK:
+            fig, ax, layers = _get_court_figure(('crisp', figsize, target_dpi), figsize, target_dpi,
+                                                self.setup_crisp_court)
+            
+            if self.shot_data is not None and not self.shot_data.empty:
+                self.add_crisp_heatmap(ax, layers)
+                self.add_crisp_zone_labels(ax)
+            
+            ax.set_title(f'{self.player_name} - Shot Analysis', 
+                         color='white', fontsize=16, fontweight='bold', pad=15)
+            
+            self.add_perfect_legend(ax)
+            
+            if output_path is None:
+                return figure_to_qimage(fig, pad_inches=0.1,
+                                        fit=(self.frame_width, self.frame_height))
+            save_tight_figure(fig, output_path, target_dpi, pad_inches=0.1)
+    
+    render = create_smart_resolution_heatmap
+    
+    def setup_crisp_court(self, fig, ax):
         fig.patch.set_facecolor('#2b2b2b')
         ax.set_facecolor('#1d428a')
-        
-        self.draw_crisp_court(ax)
-        
-        if self.shot_data is not None and not self.shot_data.empty:
-            self.add_crisp_heatmap(ax)
-            self.add_crisp_zone_labels(ax)
-        
-        ax.set_xlim(-260, 260)
-        ax.set_ylim(-50, 430)
-        ax.set_aspect('equal')
+        fix_court_view(ax)
+        _build_court_artists(ax, 2.5, 'white', rim_color='orange', rim_size=7,
+                             rim_line_width=4, backboard_width=5)
         ax.axis('off')
-        
-        plt.title(f'{self.player_name} - Shot Analysis', 
-                  color='white', fontsize=16, fontweight='bold', pad=15)
-        
-        self.add_perfect_legend(ax)
-        
-        target_dpi = max(150, min(300, self.frame_width / fig_width_inches))
-        plt.savefig(output_path, 
-                    dpi=target_dpi,
-                    bbox_inches='tight', 
-                    facecolor='#2b2b2b',
-                    edgecolor='none',
-                    transparent=False,
-                    pad_inches=0.1,
-                    quality=95)
-        plt.close()
-    
-    def draw_crisp_court(self, ax):
-        line_color = 'white'
-        line_width = 2.5
-        
-        court = patches.Rectangle((-250, -47.5), 500, 470, 
-                                  linewidth=line_width, edgecolor=line_color, 
-                                  facecolor='none')
-        ax.add_patch(court)
-        
-        center_circle = patches.Circle((0, 0), 60, linewidth=line_width, 
-                                       edgecolor=line_color, facecolor='none')
-        ax.add_patch(center_circle)
-        
-        three_point_arc = patches.Arc((0, 0), 2*237.5, 2*237.5, 
-                                      theta1=22, theta2=158, linewidth=line_width, 
-                                      edgecolor=line_color)
-        ax.add_patch(three_point_arc)
-        
-        ax.plot([-220, -220], [-47.5, 92.5], color=line_color, linewidth=line_width)
-        ax.plot([220, 220], [-47.5, 92.5], color=line_color, linewidth=line_width)
-        
-        paint = patches.Rectangle((-80, -47.5), 160, 190, 
-                                  linewidth=line_width, edgecolor=line_color, 
-                                  facecolor='none')
-        ax.add_patch(paint)
-        
-        ft_semicircle = patches.Arc((0, 142.5), 120, 120,
-                                    theta1=0, theta2=180,
-                                    linewidth=line_width, 
-                                    edgecolor=line_color, facecolor='none', alpha=0.9)
-        ax.add_patch(ft_semicircle)
-        
-        basket = patches.Circle((0, 0), 7, linewidth=4, 
-                                edgecolor='orange', facecolor='orange')
-        ax.add_patch(basket)
-        
-        ax.plot([-30, 30], [-7.5, -7.5], color='white', linewidth=5)
-    
-    def add_crisp_heatmap(self, ax):
+        return create_data_layers(ax, self._CMAP_HOT, 0.8, 'none')
+    
+    def add_crisp_heatmap(self, ax, layers):
         if 'x' not in self.shot_data.columns or 'y' not in self.shot_data.columns:
             return
         
-        x = self.shot_data['x'].values
-        y = self.shot_data['y'].values
-        made = self.shot_data['shot_made_flag'].values
+        x, y, (made_x, made_y), (missed_x, missed_y) = split_made_missed(self.shot_data)
         
-        colors_hot = ['#001a4d', '#003380', '#0066cc', '#0099ff', '#33ccff', 
-                      '#66ffcc', '#ccff66', '#ffcc33', '#ff9900', '#ff3300']
-        cmap_hot = LinearSegmentedColormap.from_list('crisp_hot', colors_hot)
-        
-        made_x = x[made == 1]
-        made_y = y[made == 1]
+        shot_density = len(made_x) / 1000
+        optimal_bins = max(30, min(60, int(40 + shot_density * 20)))
         
         if len(made_x) > 0:
-            shot_density = len(made_x) / 1000
-            optimal_bins = max(30, min(60, int(40 + shot_density * 20)))
-            
-            H_made, xedges, yedges = np.histogram2d(made_x, made_y, 
-                                                    bins=optimal_bins,
-                                                    range=[[-250, 250], [-47.5, 422.5]])
-            sigma = 0.1
-            H_made = ndimage.gaussian_filter(H_made, sigma=sigma)
-            
-            extent = [xedges[0], xedges[-1], yedges[0], yedges[-1]]
-            ax.imshow(H_made.T, extent=extent, origin='lower', 
-                      cmap=cmap_hot, alpha=0.8, aspect='auto',
-                      interpolation='none')
+            H_made, xedges, yedges = smoothed_histogram_court(made_x, made_y, optimal_bins)
+            update_image_layer(layers['heatmap'], H_made.T, xedges, yedges)
+        
+        if len(x) > DENSE_SHOT_THRESHOLD:
+            rgba, xedges, yedges = shot_density_rgba(made_x, made_y, missed_x, missed_y, optimal_bins)
+            update_image_layer(layers['density'], rgba, xedges, yedges)
+            return
         
         dot_size = max(6, min(12, self.frame_width / 50))
         edge_width = max(0.5, min(1.0, dot_size / 10))
         
-        ax.scatter(made_x, made_y, c='#4CAF50', s=dot_size, alpha=0.9,
-                   edgecolors='white', linewidth=edge_width, label='Made')
-        
-        missed_x = x[made == 0]
-        missed_y = y[made == 0]
-        ax.scatter(missed_x, missed_y, c='#F44336', s=dot_size, alpha=0.7,
-                   edgecolors='white', linewidth=edge_width, label='Missed')
+        update_outcome_layer(layers['shots'], made_x, made_y, missed_x, missed_y,
+                             ('#4CAF50', 0.9, dot_size), ('#F44336', 0.7, dot_size), edge_width)
     
     def add_crisp_zone_labels(self, ax):
         if not self.zones_data:
             return
         
-        zone_positions = {
-            'Restricted Area': (0, 60),
-            'In The Paint (Non-RA)': (0, 130),
-            'Mid-Range': (0, 200),
-            'Above the Break 3': (0, 300),
-            'Left Corner 3': (-200, 40),
-            'Right Corner 3': (200, 40),
-        }
-        
         label_font_size = max(8, min(14, self.frame_width / 40))
         
+        labels, pcts = [], []
         for zone_name, stats in self.zones_data.items():
-            if zone_name in zone_positions:
-                x, y = zone_positions[zone_name]
+            if zone_name in ZONE_LABEL_POSITIONS_CRISP:
+                x, y = ZONE_LABEL_POSITIONS_CRISP[zone_name]
                 attempts = stats.get('attempted', 0)
                 made = stats.get('made', 0)
                 pct = stats.get('percentage', 0)
                 
                 if attempts > 0:
-                    label_text = f"{pct:.1f}%\n{made}/{attempts}"
-                    
-                    if pct >= 50:
-                        bg_color = '#4CAF50'
-                    elif pct >= 40:
-                        bg_color = '#FFC107'
-                    elif pct >= 30:
-                        bg_color = '#FF9800'
-                    else:
-                        bg_color = '#F44336'
-                    
-                    ax.text(x, y, label_text, fontsize=label_font_size, fontweight='bold',
-                            ha='center', va='center', color='white',
-                            bbox=dict(boxstyle='round,pad=0.4', facecolor=bg_color,
-                                      edgecolor='white', linewidth=1.5, alpha=0.95))
+                    labels.append((x, y, f"{pct:.1f}%\n{made}/{attempts}"))
+                    pcts.append(pct)
+        
+        colors = zone_colors(pcts, ZONE_PALETTE_CRISP)
+        add_zone_labels(ax, [(*label, color) for label, color in zip(labels, colors)],
+                        label_font_size, pad=0.4, linewidth=1.5)
     
     def add_perfect_legend(self, ax):
         marker_size = max(8, min(15, self.frame_width / 35))
         font_size = max(8, min(12, self.frame_width / 45))
         
         legend_elements = [
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#4CAF50', 
+            Line2D([0], [0], marker='o', color='w', markerfacecolor='#4CAF50', 
                        markersize=marker_size, label='Made Shots', linestyle='None'),
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#F44336', 
+            Line2D([0], [0], marker='o', color='w', markerfacecolor='#F44336', 
                        markersize=marker_size, label='Missed Shots', linestyle='None'),
         ]
         
@@ -228,45 +586,48 @@ class ShotZoneCalculator:
     def __init__(self):
         self.zone_stats: Dict[str, Dict[str, Union[int, float]]] = {}
         self.zone_column = None
+        # (weak reference to the last frame scanned, its zone column); a weakref can't match a
+        # new frame that happens to reuse a freed one's id()
+        self._zone_col_cache = None
     
     def calculate_zones(self, shot_data: pd.DataFrame) -> Dict[str, Dict[str, Union[int, float]]]:
         if shot_data.empty:
             return {}
         
-        print(f"Calculating zones for {len(shot_data)} shots")
+        logger.debug("Calculating zones for %s shots", len(shot_data))
         zone_column = self._find_best_zone_column(shot_data)
         if not zone_column:
-            print("No zone column found in data")
+            logger.debug("No zone column found in data")
             return {}
         
-        print(f"Using original NBA zones from: {zone_column}")
+        logger.debug("Using original NBA zones from: %s", zone_column)
         self.zone_column = zone_column
         
-        data = shot_data.copy()
-        if 'Backcourt' in data[zone_column].values:
-            original_count = len(data)
-            data = data[data[zone_column] != 'Backcourt']
-            filtered_count = len(data)
-            print(f"Filtered out {original_count - filtered_count} backcourt shots")
-        
-        zone_stats = data.groupby(zone_column).agg({
-            'shot_made_flag': ['count', 'sum']
-        })
-        
-        zone_stats.columns = ['attempted', 'made']
-        zone_stats['percentage'] = (zone_stats['made'] / zone_stats['attempted'] * 100).round(1)
-        
-        result = {}
-        for zone_name, row in zone_stats.iterrows():
-            if pd.notna(zone_name):
-                result[str(zone_name)] = {
-                    'attempted': int(row['attempted']),
-                    'made': int(row['made']),
-                    'percentage': float(row['percentage'])
-                }
+        # Factorize once and drop backcourt shots by code, instead of a string scan and a row copy
+        codes, zone_names = pd.factorize(shot_data[zone_column], sort=False)
+        made = shot_data['shot_made_flag'].to_numpy(dtype=np.int8, copy=False)
+        valid = codes >= 0
+        attempted = np.bincount(codes[valid], minlength=len(zone_names))
+        made_counts = np.bincount(codes[valid], weights=made[valid], minlength=len(zone_names)).astype(np.int64)
+        percentages = np.round(made_counts / np.maximum(attempted, 1) * 100, 1)
+        
+        backcourt = zone_names == 'Backcourt'
+        if backcourt.any():
+            logger.debug("Filtered out %s backcourt shots", int(attempted[backcourt].sum()))
+        
+        result = {
+            str(zone_name): {
+                'attempted': int(attempts),
+                'made': int(makes),
+                'percentage': float(pct)
+            }
+            for zone_name, attempts, makes, pct, skip in zip(zone_names, attempted, made_counts,
+                                                             percentages, backcourt)
+            if not skip
+        }
         
         self.zone_stats = result
-        print(f"Using original NBA zones ({len(result)} zones).")
+        logger.debug("Using original NBA zones (%s zones).", len(result))
         return result
     
     def _find_best_zone_column(self, shot_data: pd.DataFrame) -> Union[str, None]:
@@ -277,13 +638,21 @@ class ShotZoneCalculator:
             'action_type',
             'shot_type'
         ]
+        if self._zone_col_cache is not None and self._zone_col_cache[0]() is shot_data:
+            return self._zone_col_cache[1]
+        
+        best = None
         for col in zone_columns:
             if col in shot_data.columns:
-                unique_zones = shot_data[col].nunique()
-                print(f"{col}: {unique_zones} unique zones")
-                if unique_zones > 1:
-                    return col
-        return None
+                values = shot_data[col]
+                # Two differing leading rows settle it without a full nunique scan
+                if values.iloc[:2].nunique() > 1 or values.nunique() > 1:
+                    best = col
+                    break
+                logger.debug("%s: only one unique zone", col)
+        
+        self._zone_col_cache = (weakref.ref(shot_data), best)
+        return best
     
     def get_zone_summary(self) -> Dict[str, Union[int, float]]:
         if not self.zone_stats:
@@ -299,244 +668,114 @@ class ShotZoneCalculator:
             'overall_percentage': round(overall_pct, 1)
         }
 
-class Optimal700x550HeatmapGenerator(QThread):
-    image_ready = pyqtSignal(str)
-    
-    def __init__(self, shot_data, player_name, zones_data, frame_size):
-        super().__init__()
-        self.shot_data = shot_data
-        self.player_name = player_name
-        self.zones_data = zones_data
-        self.frame_width = frame_size.width()
-        self.frame_height = frame_size.height()
+class Optimal700x550HeatmapGenerator(HeatmapGenerator):
+    _CMAP_HOT = register_cmap(LinearSegmentedColormap.from_list('optimal_hot', [
+        '#001122', '#003366', '#0066aa', '#0099ee', '#33ccff', 
+        '#66ffcc', '#ccff66', '#ffcc33', '#ff9900', '#ff4400', '#cc0000'
+    ]))
     
-    def run(self):
-        try:
-            temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-            image_path = temp_file.name
-            temp_file.close()
-            self.create_optimal_heatmap(image_path)
-            self.image_ready.emit(image_path)
-        except Exception as e:
-            print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def draw_optimal_court(self, ax, target_width):
-        line_width = max(2.0, target_width / 600)
-        line_color = '#ffffff'
-        
-        court = patches.Rectangle((-250, -47.5), 500, 470, 
-                                  linewidth=line_width, edgecolor=line_color, 
-                                  facecolor='none', alpha=0.9)
-        ax.add_patch(court)
-        
-        center_circle = patches.Circle((0, 0), 60, linewidth=line_width, 
-                                       edgecolor=line_color, facecolor='none', alpha=0.9)
-        ax.add_patch(center_circle)
-        
-        three_point_arc = patches.Arc((0, 0), 2*237.5, 2*237.5, 
-                                      theta1=22, theta2=158, linewidth=line_width, 
-                                      edgecolor=line_color, alpha=0.9)
-        ax.add_patch(three_point_arc)
-        
-        ax.plot([-220, -220], [-47.5, 92.5], color=line_color, linewidth=line_width, alpha=0.9)
-        ax.plot([220, 220], [-47.5, 92.5], color=line_color, linewidth=line_width, alpha=0.9)
-        
-        paint = patches.Rectangle((-80, -47.5), 160, 190, 
-                                  linewidth=line_width, edgecolor=line_color, 
-                                  facecolor='none', alpha=0.9)
-        ax.add_patch(paint)
-        
-        ft_semicircle = patches.Arc((0, 142.5), 120, 120,
-                                    theta1=0, theta2=180,
-                                    linewidth=line_width, 
-                                    edgecolor=line_color, facecolor='none', alpha=0.9)
-        ax.add_patch(ft_semicircle)
-        
-        rim_size = max(7, target_width / 200)
-        rim = patches.Circle((0, 0), rim_size, linewidth=line_width, 
-                             edgecolor='#ff6b35', facecolor='#ff6b35', alpha=1.0)
-        ax.add_patch(rim)
-        
-        backboard_width = line_width * 1.5
-        ax.plot([-30, 30], [-7.5, -7.5], color=line_color, linewidth=backboard_width, alpha=0.9)
-    
-    def create_optimal_heatmap(self, output_path):
-        import matplotlib
-        matplotlib.use('Agg')
-        
+    def create_optimal_heatmap(self, output_path=None):
         multiplier = 2.5
         target_width = int(self.frame_width * multiplier)
         target_height = int(self.frame_height * multiplier)
         
-        dpi = 175
-        fig_width = target_width / dpi
-        fig_height = target_height / dpi
+        layout_dpi = 175
+        fig_width = target_width / layout_dpi
+        fig_height = target_height / layout_dpi
         
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height), dpi=dpi)
+        # The display copy is rasterized at 1.5x the frame rather than 2.5x; exports keep layout_dpi
+        dpi = layout_dpi * 1.5 / multiplier
+        figsize = (fig_width, fig_height)
+        
+        with _COURT_CACHE_LOCK:
+            fig, ax, layers = _get_court_figure(('optimal', figsize, dpi), figsize, dpi,
+                                                lambda f, a: self.setup_optimal_court(f, a, target_width))
+            
+            if self.shot_data is not None and not self.shot_data.empty:
+                self.add_optimal_heatmap(ax, layers, target_width)
+                self.add_optimal_zones(ax, target_width)
+            
+            title_size = target_width / 62
+            ax.set_title(f'{self.player_name} - Shot Analysis', 
+                         color='white', fontsize=title_size, fontweight='bold', pad=15)
+            
+            self.add_optimal_legend(ax, target_width)
+            
+            if output_path is None:
+                return figure_to_qimage(fig, pad_inches=0.02,
+                                        fit=(self.frame_width, self.frame_height))
+            save_tight_figure(fig, output_path, layout_dpi, pad_inches=0.02)
+    
+    render = create_optimal_heatmap
+    
+    def setup_optimal_court(self, fig, ax, target_width):
         fig.patch.set_facecolor('#1a1a1a')
         ax.set_facecolor('#0a1929')
-        
-        plt.subplots_adjust(left=0.015, right=0.985, top=0.935, bottom=0.065)
-        self.draw_optimal_court(ax, target_width)
-        
-        if self.shot_data is not None and not self.shot_data.empty:
-            self.add_optimal_heatmap(ax, target_width)
-            self.add_optimal_zones(ax, target_width)
-        
-        ax.set_xlim(-260, 260)
-        ax.set_ylim(-50, 430)
-        ax.set_aspect('equal')
+        fig.subplots_adjust(left=0.015, right=0.985, top=0.935, bottom=0.065)
+        fix_court_view(ax)
+        _build_court_artists(ax, max(2.0, target_width / 600), '#ffffff', alpha=0.9,
+                             rim_color='#ff6b35', rim_size=max(7, target_width / 200))
         ax.axis('off')
-        
-        title_size = target_width / 62
-        plt.title(f'{self.player_name} - Shot Analysis', 
-                  color='white', fontsize=title_size, fontweight='bold', pad=15)
-        
-        self.add_optimal_legend(ax, target_width)
-        
-        plt.savefig(output_path, 
-                    dpi=dpi,
-                    bbox_inches='tight',
-                    pad_inches=0.02,
-                    facecolor='#1a1a1a',
-                    edgecolor='none',
-                    transparent=False)
-        plt.close()
+        return create_data_layers(ax, self._CMAP_HOT, 0.75, 'bilinear')
     
-    def draw_export_court(self, ax):
-        line_color = '#ffffff'
-        line_width = 2.5
-        
-        court = patches.Rectangle((-250, -47.5), 500, 470, 
-                                  linewidth=line_width, edgecolor=line_color, 
-                                  facecolor='none', alpha=0.8)
-        ax.add_patch(court)
-        
-        center_circle = patches.Circle((0, 0), 60, linewidth=line_width, 
-                                       edgecolor=line_color, facecolor='none', alpha=0.8)
-        ax.add_patch(center_circle)
-        
-        three_point_arc = patches.Arc((0, 0), 2*237.5, 2*237.5, 
-                                      theta1=22, theta2=158, linewidth=line_width, 
-                                      edgecolor=line_color, alpha=0.8)
-        ax.add_patch(three_point_arc)
-        
-        ax.plot([-220, -220], [-47.5, 92.5], color=line_color, linewidth=line_width, alpha=0.8)
-        ax.plot([220, 220], [-47.5, 92.5], color=line_color, linewidth=line_width, alpha=0.8)
-        
-        paint = patches.Rectangle((-80, -47.5), 160, 190, 
-                                  linewidth=line_width, edgecolor=line_color, 
-                                  facecolor='none', alpha=0.8)
-        ax.add_patch(paint)
-        
-        ft_semicircle = patches.Arc((0, 142.5), 120, 120,
-                                    theta1=0, theta2=180,
-                                    linewidth=line_width, 
-                                    edgecolor=line_color, facecolor='none', alpha=0.9)
-        ax.add_patch(ft_semicircle)
-        
-        rim = patches.Circle((0, 0), 9, linewidth=line_width, 
-                             edgecolor='#e74c3c', facecolor='#e74c3c', alpha=0.9)
-        ax.add_patch(rim)
-        
-        ax.plot([-30, 30], [-7.5, -7.5], color=line_color, linewidth=line_width * 1.2, alpha=0.8)
-    
-    def add_optimal_heatmap(self, ax, target_width):
+    def add_optimal_heatmap(self, ax, layers, target_width):
         if 'x' not in self.shot_data.columns or 'y' not in self.shot_data.columns:
             return
         
-        x = self.shot_data['x'].values
-        y = self.shot_data['y'].values
-        made = self.shot_data['shot_made_flag'].values
+        x, y, (made_x, made_y), (missed_x, missed_y) = split_made_missed(self.shot_data)
         
-        colors_hot = [
-            '#001122', '#003366', '#0066aa', '#0099ee', '#33ccff', 
-            '#66ffcc', '#ccff66', '#ffcc33', '#ff9900', '#ff4400', '#cc0000'
-        ]
-        cmap_hot = LinearSegmentedColormap.from_list('optimal_hot', colors_hot)
-        
-        made_x = x[made == 1]
-        made_y = y[made == 1]
+        base_bins = 45
+        resolution_factor = target_width / 1000
+        optimal_bins = int(base_bins * resolution_factor)
+        optimal_bins = max(30, min(80, optimal_bins))
         
         if len(made_x) > 0:
-            base_bins = 45
-            resolution_factor = target_width / 1000
-            optimal_bins = int(base_bins * resolution_factor)
-            optimal_bins = max(30, min(80, optimal_bins))
-            
-            H_made, xedges, yedges = np.histogram2d(made_x, made_y, 
-                                                    bins=optimal_bins,
-                                                    range=[[-250, 250], [-47.5, 422.5]])
             sigma = 0.8 * (target_width / 1000)
-            H_made = ndimage.gaussian_filter(H_made, sigma=sigma)
-            
-            extent = [xedges[0], xedges[-1], yedges[0], yedges[-1]]
-            ax.imshow(H_made.T, extent=extent, origin='lower', 
-                      cmap=cmap_hot, alpha=0.75, aspect='auto',
-                      interpolation='bilinear')
+            H_made, xedges, yedges = smoothed_histogram_court(made_x, made_y, optimal_bins, sigma)
+            update_image_layer(layers['heatmap'], H_made.T, xedges, yedges)
+        
+        if len(x) > DENSE_SHOT_THRESHOLD:
+            rgba, xedges, yedges = shot_density_rgba(made_x, made_y, missed_x, missed_y, optimal_bins)
+            update_image_layer(layers['density'], rgba, xedges, yedges)
+            return
         
         dot_size = max(8, target_width / 140)
         edge_width = max(0.8, target_width / 1400)
         
-        ax.scatter(made_x, made_y, c='#00FF7F', s=dot_size, alpha=0.9,
-                   edgecolors='white', linewidth=edge_width, label='Made')
-        
-        missed_x = x[made == 0]
-        missed_y = y[made == 0]
-        ax.scatter(missed_x, missed_y, c='#FF4444', s=dot_size * 0.85, alpha=0.8,
-                   edgecolors='white', linewidth=edge_width, label='Missed')
+        update_outcome_layer(layers['shots'], made_x, made_y, missed_x, missed_y,
+                             ('#00FF7F', 0.9, dot_size), ('#FF4444', 0.8, dot_size * 0.85), edge_width)
     
     def add_optimal_zones(self, ax, target_width):
         if not self.zones_data:
             return
         
-        zone_positions = {
-            'Restricted Area': (0, 70),
-            'In The Paint (Non-RA)': (0, 140),
-            'Mid-Range': (0, 210),
-            'Above the Break 3': (0, 305),
-            'Left Corner 3': (-180, 50),
-            'Right Corner 3': (180, 50),
-        }
-        
         label_font_size = max(10, target_width / 120)
+        padding = max(0.4, target_width / 3000)
         
+        labels, pcts = [], []
         for zone_name, stats in self.zones_data.items():
-            if zone_name in zone_positions:
-                x, y = zone_positions[zone_name]
+            if zone_name in ZONE_LABEL_POSITIONS:
+                x, y = ZONE_LABEL_POSITIONS[zone_name]
                 attempts = stats.get('attempted', 0)
                 made = stats.get('made', 0)
                 pct = stats.get('percentage', 0)
                 
                 if attempts > 0:
-                    label_text = f"{pct:.1f}%\n{made}/{attempts}"
-                    
-                    if pct >= 50:
-                        bg_color = '#00C853'
-                    elif pct >= 40:
-                        bg_color = '#FFB300'
-                    elif pct >= 30:
-                        bg_color = '#FF8F00'
-                    else:
-                        bg_color = '#D32F2F'
-                    
-                    padding = max(0.4, target_width / 3000)
-                    
-                    ax.text(x, y, label_text, fontsize=label_font_size, fontweight='bold',
-                            ha='center', va='center', color='white',
-                            bbox=dict(boxstyle=f'round,pad={padding}', facecolor=bg_color,
-                                      edgecolor='white', linewidth=2, alpha=0.95))
+                    labels.append((x, y, f"{pct:.1f}%\n{made}/{attempts}"))
+                    pcts.append(pct)
+        
+        colors = zone_colors(pcts, ZONE_PALETTE_OPTIMAL)
+        add_zone_labels(ax, [(*label, color) for label, color in zip(labels, colors)],
+                        label_font_size, pad=padding, linewidth=2)
     
     def add_optimal_legend(self, ax, target_width):
         marker_size = max(10, target_width / 140)
         font_size = max(9, target_width / 150)
         
         legend_elements = [
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#00FF7F', 
+            Line2D([0], [0], marker='o', color='w', markerfacecolor='#00FF7F', 
                        markersize=marker_size, label='Made Shots', linestyle='None'),
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#FF4444', 
+            Line2D([0], [0], marker='o', color='w', markerfacecolor='#FF4444', 
                        markersize=marker_size, label='Missed Shots', linestyle='None'),
         ]
         
@@ -545,45 +784,25 @@ class Optimal700x550HeatmapGenerator(QThread):
                   shadow=True, frameon=True, facecolor='white', 
                   edgecolor='gray', fontsize=font_size, framealpha=1.0)
 
-def update_court_image_ultra_quality(self, image_path):
+def update_court_image_ultra_quality(self, image):
     try:
-        print(f"[ULTRA QUALITY] Loading heatmap from: {image_path}")
-        
-        if not os.path.exists(image_path):
-            print(f"Image file not found: {image_path}")
-            self.show_error_message("Heatmap file not found")
-            return
-        
-        file_size = os.path.getsize(image_path)
-        print(f"Image file size: {file_size:,} bytes")
-        
-        if file_size < 1000:
-            print("Image file too small, likely corrupted")
+        if image.isNull():
+            logger.debug("Received an empty heatmap image")
             self.show_error_message("Heatmap generation failed")
             return
         
-        pixmap = QPixmap(image_path)
-        if pixmap.isNull():
-            print(f"Failed to load pixmap from: {image_path}")
-            self.show_error_message("Failed to load heatmap image")
-            return
-        
-        print(f"Pixmap loaded. Original size: {pixmap.width()}x{pixmap.height()}")
+        pixmap = QPixmap.fromImage(image)
+        logger.debug("Pixmap ready. Original size: %sx%s", pixmap.width(), pixmap.height())
         
         frame_width = self.ui.frame.width()
         frame_height = self.ui.frame.height()
-        print(f"Frame dimensions: {frame_width}x{frame_height}")
+        logger.debug("Frame dimensions: %sx%s", frame_width, frame_height)
         
         if frame_width <= 0 or frame_height <= 0:
-            print("Invalid frame dimensions")
+            logger.debug("Invalid frame dimensions")
             return
         
-        for child in self.ui.frame.findChildren(QLabel):
-            child.deleteLater()
-        QApplication.processEvents()
-        
-        heatmap_label = QLabel(self.ui.frame)
-        heatmap_label.setObjectName("ultra_quality_heatmap_display_label")
+        heatmap_label = self._frame_label
         heatmap_label.setGeometry(0, 0, frame_width, frame_height)
         
         scaled_pixmap = pixmap.scaled(
@@ -592,45 +811,92 @@ def update_court_image_ultra_quality(self, image_path):
             Qt.TransformationMode.SmoothTransformation
         )
         
-        print(f"Scaled image size: {scaled_pixmap.width()}x{scaled_pixmap.height()}")
+        logger.debug("Scaled image size: %sx%s", scaled_pixmap.width(), scaled_pixmap.height())
         
+        heatmap_label.setStyleSheet(HEATMAP_LABEL_STYLE)
         heatmap_label.setPixmap(scaled_pixmap)
-        heatmap_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        heatmap_label.setStyleSheet("""
-            QLabel {
-                border: none;
-                background-color: transparent;
-                padding: 0px;
-                margin: 0px;
-            }
-        """)
         heatmap_label.show()
         heatmap_label.raise_()
         
-        self.ui.frame.update()
-        self.ui.centralwidget.update()
-        self.update()
-        QApplication.processEvents()
-        
-        print("[ULTRA QUALITY] Heatmap displayed.")
+        logger.debug("[ULTRA QUALITY] Heatmap displayed.")
         self.current_heatmap_label = heatmap_label
-        
-        QApplication.instance().processEvents()
-        import time
-        time.sleep(0.5)
-        try:
-            if os.path.exists(image_path):
-                os.unlink(image_path)
-                print("Temporary heatmap file cleaned up")
-        except Exception as cleanup_error:
-            print(f"Could not clean up temp file: {cleanup_error}")
-            
     except Exception as e:
-        print(f"[ULTRA QUALITY] Error updating heatmap display: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ULTRA QUALITY] Error updating heatmap display")
         self.show_error_message(f"Display error: {str(e)}")
 
+class ShotLoaderSignals(QObject):
+    shots_loaded = pyqtSignal(str, str, object, object)
+    load_failed = pyqtSignal(str, str, str)
+
+class ShotLoader(QRunnable):
+    """Load a player's shots and build their filter engine off the GUI thread"""
+    
+    def __init__(self, data_manager, season, player):
+        super().__init__()
+        self.signals = ShotLoaderSignals()
+        self.data_manager = data_manager
+        self.season = season
+        self.player = player
+    
+    def run(self):
+        try:
+            shot_data = self.data_manager.load_player_shots(self.season, self.player)
+            filter_engine = None
+            if shot_data is not None and not shot_data.empty:
+                filter_engine = NBAFilterEngine(shot_data)
+            self.signals.shots_loaded.emit(self.season, self.player, shot_data, filter_engine)
+        except Exception as e:
+            logger.exception("Error loading player shots")
+            self.signals.load_failed.emit(self.season, self.player, str(e))
+
+HEATMAP_LABEL_STYLE = """
+QLabel {
+    border: none;
+    background-color: transparent;
+    padding: 0px;
+    margin: 0px;
+}
+"""
+
+# Role-based selectors so styling is applied with one application-wide polish pass
+FILTER_STYLESHEET = """
+QComboBox[role="filter"] {
+    selection-background-color: #4CAF50;
+}
+"""
+
+# Hover feedback is colour-only: QSS has no transform, and unknown properties are re-parsed on every polish
+CONTROL_STYLESHEET = """
+QPushButton[role="action"] {
+    background-color: #4CAF50;
+    border: none;
+    border-radius: 8px;
+    color: white;
+    font-weight: bold;
+    font-size: 12px;
+    padding: 4px 10px;
+}
+QPushButton[role="action"]:hover {
+    background-color: #45a049;
+}
+QPushButton[role="action"]:pressed {
+    background-color: #3d8b40;
+}
+QPushButton[role="action"]:disabled {
+    background-color: #cccccc;
+    color: #666666;
+}
+"""
+
+def apply_global_stylesheet(qss):
+    """Append qss to the application stylesheet once; repeated calls are no-ops"""
+    app = QApplication.instance()
+    if app is None:
+        return
+    current = app.styleSheet()
+    if qss not in current:
+        app.setStyleSheet(current + qss)
+
 class NBAShotAnalyzer(QMainWindow):
     """NBA Shot Analyzer with Smart Resolution Heatmap System"""
     
@@ -656,7 +922,8 @@ class NBAShotAnalyzer(QMainWindow):
             border: none;
         }
         """)
-        self.data_manager = EnhancedNBADataManager()
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        self.data_manager = EnhancedNBADataManager(cache_dir=os.path.join(cache_root, 'datasets'))
         self.filter_engine = None
         self.zone_calculator = ShotZoneCalculator()
         
@@ -665,31 +932,91 @@ class NBAShotAnalyzer(QMainWindow):
         self.current_team = None
         self.current_player = None
         self.current_heatmap_label = None
+        # (filter key, filtered shots, zones) from the last calculation, reused by export
+        self._last_filtered = None
+        # Set while calculate_shots runs; a nested event loop must not re-enter it
+        self._calc_in_progress = False
+        # get_current_filters result, dropped whenever a filter combo changes
+        self._cached_filters = None
+        
+        # Single label reused for placeholder, loading, error and heatmap states
+        self._frame_label = QLabel(self.ui.frame)
+        self._frame_label.setGeometry(self.ui.frame.rect())
+        self._frame_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.ui.frame.installEventFilter(self)
+        # Unscaled pixmap of the heatmap on show, so frame resizes rescale it without re-converting
+        self._raw_heatmap_pm = None
+        self._shown_heatmap_fit = None
+        # Drag-resizes scale with FastTransformation; one smooth pass follows once they settle
+        self._smooth_rescale_timer = QTimer(self)
+        self._smooth_rescale_timer.setSingleShot(True)
+        self._smooth_rescale_timer.setInterval(150)
+        self._smooth_rescale_timer.timeout.connect(self.rescale_heatmap_smooth)
+        
+        # One long-lived render worker: keeps matplotlib's caches warm between heatmaps
+        self.heatmap_pool = QThreadPool()
+        self.heatmap_pool.setMaxThreadCount(1)
+        self.heatmap_pool.setExpiryTimeout(-1)
+        # Player loads run one at a time: filter engines share class-level scratch buffers
+        self.loader_pool = QThreadPool()
+        self.loader_pool.setMaxThreadCount(1)
+        # Rendered heatmaps are reused when the user flips back to recent filter settings
+        QPixmapCache.setCacheLimit(65536)
+        # ...and across sessions from a size-capped PNG cache on disk
+        self._disk_cache_dir = os.path.join(cache_root, 'heatmaps')
+        try:
+            os.makedirs(self._disk_cache_dir, exist_ok=True)
+        except OSError as e:
+            logger.warning("Heatmap disk cache unavailable: %s", e)
+            self._disk_cache_dir = None
         
         self.setup_ui()
         self.setup_dropdown_hover()
+        self.setup_button_styling()
         self.connect_signals()
         self.setup_debug_shortcuts()
         self.setup_export_functionality()
+        self.heatmap_pool.start(prewarm_matplotlib)
+        if self._disk_cache_dir is not None:
+            # Scanning and trimming up to HEATMAP_DISK_CACHE_BYTES of PNGs stays off the GUI thread;
+            # the heatmap worker also does the cache writes, so the two never interleave
+            cache_dir = self._disk_cache_dir
+            self.heatmap_pool.start(lambda: prune_disk_cache(cache_dir, HEATMAP_DISK_CACHE_BYTES))
         
     def setup_ui(self):
         seasons = self.data_manager.get_available_seasons()
         self.ui.comboBox_9.clear()
         self.ui.comboBox_9.addItems(["Select Season"] + seasons)
         
-        self.ui.comboBox_10.clear()
-        self.ui.comboBox_10.addItems(["Select Team"])
+        # Team/player lists are swapped wholesale, so back them with plain string models
+        self.ui.comboBox_10.setModel(QStringListModel(self.ui.comboBox_10))
+        self.ui.comboBox_11.setModel(QStringListModel(self.ui.comboBox_11))
+        for combo in (self.ui.comboBox_10, self.ui.comboBox_11):
+            # Fixed-geometry combos: skip measuring every team/player name on populate
+            combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+            combo.setMinimumContentsLength(20)
+        self.set_combo_items(self.ui.comboBox_10, ["Select Team"])
         self.ui.comboBox_10.setEnabled(False)
         
-        self.ui.comboBox_11.clear()
-        self.ui.comboBox_11.addItems(["Select Player"])
+        self.set_combo_items(self.ui.comboBox_11, ["Select Player"])
         self.ui.comboBox_11.setEnabled(False)
         
         self.setup_filters()
         self.setup_labels()
         self.ui.pushButton.setEnabled(False)
-        print(f"UI setup complete with {len(seasons)} seasons")
+        logger.debug("UI setup complete with %s seasons", len(seasons))
         
+    def set_combo_items(self, combo, items):
+        """Replace a combo's items in one model reset without firing index signals"""
+        was_blocked = combo.blockSignals(True)
+        combo.view().setUpdatesEnabled(False)
+        try:
+            combo.model().setStringList(items)
+            combo.setCurrentIndex(0)
+        finally:
+            combo.view().setUpdatesEnabled(True)
+            combo.blockSignals(was_blocked)
+    
     def setup_filters(self):
         self.ui.comboBox.clear()
         self.ui.comboBox.addItems(['All', 'Home', 'Away'])
@@ -759,7 +1086,7 @@ class NBAShotAnalyzer(QMainWindow):
             self.ui.label_17.setText("Minutes Played:")
             self.ui.label_18.setText("Win/Loss Streak:")
         except AttributeError as e:
-            print(f"Some labels not found in UI: {e}")
+            logger.warning("Some labels not found in UI: %s", e)
     
     def setup_dropdown_hover(self):
         combos = [
@@ -768,53 +1095,16 @@ class NBAShotAnalyzer(QMainWindow):
             self.ui.comboBox_9, self.ui.comboBox_10, self.ui.comboBox_11
         ]
         for combo in combos:
-            combo.setStyleSheet("""
-                QComboBox {
-                    selection-background-color: #4CAF50;
-                }
-            """)
+            combo.setProperty("role", "filter")
+        apply_global_stylesheet(FILTER_STYLESHEET)
                         
-    def apply_complete_dropdown_styling(main_window):
-        button_style = """
-        QPushButton {
-            background-color: #4CAF50;
-            border: none;
-            border-radius: 8px;
-            color: white;
-            font-weight: bold;
-            font-size: 12px;
-            padding: 10px 20px;
-            min-height: 15px;
-        }
-        QPushButton:hover {
-            background-color: #45a049;
-            transform: translateY(-1px);
-        }
-        QPushButton:pressed {
-            background-color: #3d8b40;
-            transform: translateY(0px);
-        }
-        QPushButton:disabled {
-            background-color: #cccccc;
-            color: #666666;
-        }
-        """
-        main_window.ui.pushButton.setStyleSheet(button_style)
-        main_window.ui.pushButton_2.setStyleSheet(button_style)
-        
-        label_style = """
-        QLabel {
-            color: white;
-            font-weight: bold;
-            font-size: 11px;
-        }
-        """
-        labels = [main_window.ui.label_12, main_window.ui.label_13, main_window.ui.label_14, 
-                  main_window.ui.label_15, main_window.ui.label_16, main_window.ui.label_17, 
-                  main_window.ui.label_18, main_window.ui.label_19, main_window.ui.label_20, 
-                  main_window.ui.label_21, main_window.ui.label_22]
-        for label in labels:
-            label.setStyleSheet(label_style)
+    def setup_button_styling(self):
+        self.ui.pushButton.setProperty("role", "action")
+        self.ui.pushButton_2.setProperty("role", "action")
+        # Installed on the central widget, not the application: its Designer "QWidget { background-color:
+        # transparent }" rule sits closer to the buttons and would override an application-level sheet
+        central = self.ui.centralwidget
+        central.setStyleSheet(central.styleSheet() + CONTROL_STYLESHEET)
 
     def setup_export_functionality(self):
         try:
@@ -822,20 +1112,50 @@ class NBAShotAnalyzer(QMainWindow):
             export_shortcut.activated.connect(self.export_current_heatmap)
             self.ui.pushButton_2.setText("Export HD")
             self.ui.pushButton_2.clicked.connect(self.on_export_or_reset)
-        except Exception as e:
-            print(f"Could not setup export functionality: {e}")
+        except Exception:
+            logger.exception("Could not setup export functionality")
     
     def get_current_filters(self):
-        return {
-            'home_away': self.ui.comboBox.currentText(),
-            'quarter': self.ui.comboBox_2.currentText(),
-            'season_phase': self.ui.comboBox_3.currentText(),
-            'score_margin': self.ui.comboBox_4.currentText(),
-            'game_flow': self.ui.comboBox_5.currentText(),
-            'rest_days': self.ui.comboBox_6.currentText(),
-            'streak': self.ui.comboBox_7.currentText(),
-            'minutes_played': self.ui.comboBox_8.currentText()
-        }
+        if self._cached_filters is None:
+            self._cached_filters = {
+                'home_away': self.ui.comboBox.currentText(),
+                'quarter': self.ui.comboBox_2.currentText(),
+                'season_phase': self.ui.comboBox_3.currentText(),
+                'score_margin': self.ui.comboBox_4.currentText(),
+                'game_flow': self.ui.comboBox_5.currentText(),
+                'rest_days': self.ui.comboBox_6.currentText(),
+                'streak': self.ui.comboBox_7.currentText(),
+                'minutes_played': self.ui.comboBox_8.currentText()
+            }
+        return dict(self._cached_filters)
+    
+    def invalidate_filters(self, *_):
+        self._cached_filters = None
+    
+    def filter_key(self, filters):
+        return (self.current_season, self.current_player, self.current_team,
+                tuple(sorted(filters.items())))
+    
+    def filtered_shots(self, filters):
+        """Return (filtered_data, zones) for filters, reusing the last result while the key matches"""
+        key = self.filter_key(filters)
+        if self._last_filtered is not None and self._last_filtered[0] == key:
+            _, filtered_data, zones = self._last_filtered
+            # Keep get_zone_summary in step with the reused zones
+            self.zone_calculator.zone_stats = zones
+            return filtered_data, zones
+        filtered_data = self.filter_engine.apply_all_filters(
+            self.current_player, self.current_team, filters
+        )
+        zones = self.zone_calculator.calculate_zones(filtered_data)
+        self._last_filtered = (key, filtered_data, zones)
+        return filtered_data, zones
+    
+    def heatmap_cache_key(self, shot_data):
+        # Keyed on the shots themselves so filter combinations that select the same shots share
+        # one render; heatmaps are rendered at the frame's pixel size, so that is part of the key too
+        size = self.ui.frame.size()
+        return f"{self.current_player}|{shot_fingerprint(shot_data)}|{size.width()}x{size.height()}"
     
     def reset_filters(self):
         try:
@@ -847,45 +1167,39 @@ class NBAShotAnalyzer(QMainWindow):
                 combo.setCurrentIndex(0)
             
             try:
-                for child in self.ui.frame.findChildren(QLabel):
-                    child.deleteLater()
-                placeholder_label = QLabel("Optimized Resolution Court will appear here after calculating shots", self.ui.frame)
-                placeholder_label.setGeometry(0, 0, self.ui.frame.width(), self.ui.frame.height())
-                placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                placeholder_label.setStyleSheet("color: white; font-size: 14px; font-weight: bold;")
-                placeholder_label.show()
-            except Exception as e:
-                print(f"Error clearing frame: {e}")
+                self.show_frame_text("Optimized Resolution Court will appear here after calculating shots",
+                                     "color: white; font-size: 14px; font-weight: bold;")
+            except Exception:
+                logger.exception("Error clearing frame")
             
             self.show_status("Filters reset")
-            print("Filters reset")
-        except Exception as e:
-            print(f"Error resetting filters: {e}")
+            logger.debug("Filters reset")
+        except Exception:
+            logger.exception("Error resetting filters")
     
     def setup_debug_shortcuts(self):
+        # One binding per key: two QShortcuts on the same sequence make it ambiguous
+        shortcuts = [
+            ("Ctrl+Shift+D", self.debug_shot_data_structure),
+            ("Ctrl+Shift+T", self.test_zone_calculation),
+            ("Ctrl+Shift+F", self.force_test_zones),
+            ("Ctrl+D", self.debug_current_state),
+            ("Ctrl+Shift+R", self.test_frame_display),
+        ]
         try:
-            debug_data_shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
-            debug_data_shortcut.activated.connect(self.debug_shot_data_structure)
-            
-            test_zones_shortcut = QShortcut(QKeySequence("Ctrl+Shift+T"), self)
-            test_zones_shortcut.activated.connect(self.test_zone_calculation)
-            
-            force_test_shortcut = QShortcut(QKeySequence("Ctrl+Shift+F"), self)
-            force_test_shortcut.activated.connect(self.force_test_zones)
-            
-            debug_state_shortcut = QShortcut(QKeySequence("Ctrl+D"), self)
-            debug_state_shortcut.activated.connect(self.debug_current_state)
-            
-            test_frame_shortcut = QShortcut(QKeySequence("Ctrl+Shift+T"), self)
-            test_frame_shortcut.activated.connect(self.test_frame_display)
-        except Exception as e:
-            print(f"Could not setup debug shortcuts: {e}")
+            for keys, handler in shortcuts:
+                QShortcut(QKeySequence(keys), self).activated.connect(handler)
+        except Exception:
+            logger.exception("Could not setup debug shortcuts")
     
     def connect_signals(self):
         self.ui.comboBox_9.currentIndexChanged.connect(self.on_season_changed_index)
         self.ui.comboBox_10.currentIndexChanged.connect(self.on_team_changed_index)
         self.ui.comboBox_11.currentIndexChanged.connect(self.on_player_changed_index)
         self.ui.pushButton.clicked.connect(self.calculate_shots)
+        for combo in (self.ui.comboBox, self.ui.comboBox_2, self.ui.comboBox_3, self.ui.comboBox_4,
+                      self.ui.comboBox_5, self.ui.comboBox_6, self.ui.comboBox_7, self.ui.comboBox_8):
+            combo.currentIndexChanged.connect(self.invalidate_filters)
     
     def on_season_changed_index(self, index):
         if index <= 0:
@@ -909,15 +1223,13 @@ class NBAShotAnalyzer(QMainWindow):
             self.on_player_changed(player)
     
     def on_season_changed(self, season):
-        print(f"Season selected: '{season}'")
+        logger.debug("Season selected: '%s'", season)
         self.current_season = season
         
-        self.ui.comboBox_10.clear()
-        self.ui.comboBox_10.addItems(["Select Team"])
+        self.set_combo_items(self.ui.comboBox_10, ["Select Team"])
         self.ui.comboBox_10.setEnabled(False)
         
-        self.ui.comboBox_11.clear()
-        self.ui.comboBox_11.addItems(["Select Player"])
+        self.set_combo_items(self.ui.comboBox_11, ["Select Player"])
         self.ui.comboBox_11.setEnabled(False)
         
         self.ui.pushButton.setEnabled(False)
@@ -926,16 +1238,15 @@ class NBAShotAnalyzer(QMainWindow):
         try:
             teams = self.data_manager.get_teams_for_season_with_full_names(season)
             if teams:
-                self.ui.comboBox_10.clear()
-                self.ui.comboBox_10.addItems(["Select Team"] + teams)
+                self.set_combo_items(self.ui.comboBox_10, ["Select Team"] + teams)
                 self.ui.comboBox_10.setEnabled(True)
                 self.show_status(f"Loaded {len(teams)} teams")
-                print(f"Teams loaded: {teams}")
+                logger.debug("Teams loaded: %s", teams)
             else:
                 self.show_status("No teams found for this season")
-                print("No teams found")
+                logger.debug("No teams found")
         except Exception as e:
-            print(f"Error loading teams: {e}")
+            logger.exception("Error loading teams")
             self.show_status(f"Error loading teams: {str(e)}")
     
     def on_team_changed(self, team):
@@ -944,11 +1255,10 @@ class NBAShotAnalyzer(QMainWindow):
         self.current_team = team
         self.current_team_abbr = self.data_manager.get_abbreviation_from_full_name(team)
 
-        print(f"Team selected: '{team}'")
+        logger.debug("Team selected: '%s'", team)
         self.current_team = team
         
-        self.ui.comboBox_11.clear()
-        self.ui.comboBox_11.addItems(["Loading..."])
+        self.set_combo_items(self.ui.comboBox_11, ["Loading..."])
         self.ui.comboBox_11.setEnabled(False)
         self.ui.pushButton.setEnabled(False)
         
@@ -956,52 +1266,73 @@ class NBAShotAnalyzer(QMainWindow):
         try:
             players = self.data_manager.get_players_for_team_season(self.current_season, team)
             if players:
-                self.ui.comboBox_11.clear()
-                self.ui.comboBox_11.addItems(["Select Player"] + players)
+                self.set_combo_items(self.ui.comboBox_11, ["Select Player"] + players)
                 self.ui.comboBox_11.setEnabled(True)
                 self.show_status(f"Loaded {len(players)} players for {team}")
-                print(f"Players loaded: {len(players)} for {team}")
+                logger.debug("Players loaded: %s for %s", len(players), team)
             else:
-                self.ui.comboBox_11.clear()
-                self.ui.comboBox_11.addItems(["No players found"])
+                self.set_combo_items(self.ui.comboBox_11, ["No players found"])
                 self.show_status(f"No players found for {team}")
-                print(f"No players found for {team}")
+                logger.debug("No players found for %s", team)
         except Exception as e:
-            print(f"Error loading players: {e}")
-            self.ui.comboBox_11.clear()
-            self.ui.comboBox_11.addItems(["Error loading players"])
+            logger.exception("Error loading players")
+            self.set_combo_items(self.ui.comboBox_11, ["Error loading players"])
             self.show_status(f"Error loading players: {str(e)}")
     
     def on_player_changed(self, player):
         if not player or player in ["Select Player", "No players found", "Loading...", "Error loading players", ""]:
             return
         
-        print(f"Player selected: '{player}'")
+        logger.debug("Player selected: '%s'", player)
         self.current_player = player
         
         self.show_status(f"Loading shots for {player}...")
-        try:
-            self.shot_data = self.data_manager.load_player_shots(
-                self.current_season, player
-            )
-            if self.shot_data is not None and not self.shot_data.empty:
-                self.filter_engine = NBAFilterEngine(self.shot_data)
-                self.ui.pushButton.setEnabled(True)
-                shot_count = len(self.shot_data)
-                self.show_status(f"Loaded {shot_count} shots for {player}")
-                print(f"Loaded {shot_count} shots for {player}")
-                print("Calculate button ENABLED")
-            else:
-                self.ui.pushButton.setEnabled(False)
-                self.show_status(f"No shots found for {player}")
-                print(f"No shots found for {player}")
-        except Exception as e:
-            print(f"Error loading player shots: {e}")
+        self.show_frame_text(f"Loading shots for {player}...", "color: white; font-size: 14px; font-weight: bold;")
+        self.ui.pushButton.setEnabled(False)
+        # Drop the previous player's data so nothing (e.g. a Ctrl+E export) runs on it mid-load
+        self.shot_data = None
+        self.filter_engine = None
+        self._last_filtered = None
+        self.shot_loader = ShotLoader(self.data_manager, self.current_season, player)
+        self.shot_loader.signals.shots_loaded.connect(self.on_shots_loaded)
+        self.shot_loader.signals.load_failed.connect(self.on_shots_load_failed)
+        self.loader_pool.start(self.shot_loader)
+    
+    def on_shots_loaded(self, season, player, shot_data, filter_engine):
+        if (season, player) != (self.current_season, self.current_player):
+            return  # superseded by a newer selection
+        self.shot_data = shot_data
+        self._last_filtered = None
+        if filter_engine is not None:
+            self.filter_engine = filter_engine
+            self.ui.pushButton.setEnabled(True)
+            shot_count = len(self.shot_data)
+            self.show_status(f"Loaded {shot_count} shots for {player}")
+            self.show_frame_text("Optimized Resolution Court will appear here after calculating shots",
+                                 "color: white; font-size: 14px; font-weight: bold;")
+            logger.debug("Loaded %s shots for %s", shot_count, player)
+            logger.debug("Calculate button ENABLED")
+        else:
             self.ui.pushButton.setEnabled(False)
-            self.show_status(f"Error loading shots: {str(e)}")
+            self.show_status(f"No shots found for {player}")
+            self.show_frame_text(f"No shots found for {player}", "color: white; font-size: 14px; font-weight: bold;")
+            logger.debug("No shots found for %s", player)
+    
+    def on_shots_load_failed(self, season, player, error_text):
+        if (season, player) != (self.current_season, self.current_player):
+            return
+        self.ui.pushButton.setEnabled(False)
+        self.show_status(f"Error loading shots: {error_text}")
+        self.show_frame_text(f"Error loading shots: {error_text}", "color: white; font-size: 14px; font-weight: bold;")
     
     def calculate_shots(self):
-        print(f"\nCALCULATING SHOTS FOR {self.current_player}")
+        if self._calc_in_progress:
+            return
+        self._calc_in_progress = True
+        self.ui.pushButton.setEnabled(False)
+        logger.debug("CALCULATING SHOTS FOR %s", self.current_player)
+        # Set once a render is on the pool; its image-ready/error slot then ends the calculation
+        dispatched = False
         try:
             if self.shot_data is None or self.shot_data.empty:
                 QMessageBox.warning(self, "No Data", "No shot data available")
@@ -1011,20 +1342,19 @@ class NBAShotAnalyzer(QMainWindow):
                 return
             
             filters = self.get_current_filters()
-            print(f"Applying filters: {filters}")
+            logger.debug("Applying filters: %s", filters)
             
-            filtered_data = self.filter_engine.apply_all_filters(
-                self.current_player, self.current_team, filters
-            )
+            filtered_data, zones = self.filtered_shots(filters)
             if filtered_data.empty:
                 QMessageBox.information(self, "No Data", 
                                         "No shots match the selected filters.\n"
                                         "Try adjusting your filter settings.")
                 return
             
-            zones = self.zone_calculator.calculate_zones(filtered_data)
             summary = self.zone_calculator.get_zone_summary()
-            self.update_optimized_resolution_court_visualization(filtered_data, zones)
+            dispatched = self.update_optimized_resolution_court_visualization(
+                filtered_data, zones, self.heatmap_cache_key(filtered_data)
+            )
             
             total = summary['total_attempted']
             made = summary['total_made']
@@ -1033,178 +1363,113 @@ class NBAShotAnalyzer(QMainWindow):
             self.show_status(
                 f"{made}/{total} shots ({pct:.1f}%) | {active_filters} filters active | Heatmap generated"
             )
-            print(f"Analysis complete: {made}/{total} shots ({pct:.1f}%)")
+            logger.debug("Analysis complete: %s/%s shots (%.1f%%)", made, total, pct)
         except Exception as e:
-            print(f"Error in calculate_shots: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in calculate_shots")
             QMessageBox.critical(self, "Error", f"Calculation error: {str(e)}")
+        finally:
+            if not dispatched:
+                self.finish_calculation()
+    
+    def finish_calculation(self):
+        self._calc_in_progress = False
+        self.ui.pushButton.setEnabled(self.filter_engine is not None)
 
     def create_export_using_display_method(self, file_path, shot_data, zones, quality):
         try:
             frame_size = self.ui.frame.size()
-            export_generator = Optimal700x550HeatmapGenerator(
-                shot_data, self.current_player, zones, frame_size
+            self.export_generator = Optimal700x550HeatmapGenerator(
+                shot_data, self.current_player, zones, frame_size, export_path=file_path
             )
-            export_generator.create_optimal_heatmap(file_path)
+            self.export_generator.signals.export_done.connect(self.on_export_done)
+            self.export_generator.signals.export_failed.connect(self.on_export_failed)
+            self.heatmap_pool.start(self.export_generator)
+        except Exception as e:
+            logger.exception("Export error")
+            QMessageBox.critical(self, "Export Error", f"Export failed: {str(e)}")
+    
+    def on_export_done(self, file_path):
+        try:
             file_size = os.path.getsize(file_path) / (1024*1024)
+            self.show_status(f"Exported {os.path.basename(file_path)}")
             QMessageBox.information(self, "Export Complete", 
                                     f"Heatmap exported!\n\n"
                                     f"File: {os.path.basename(file_path)}\n"
                                     f"Size: {file_size:.1f} MB")
-        except Exception as e:
-            print(f"Export error: {e}")
-            QMessageBox.critical(self, "Export Error", f"Export failed: {str(e)}")
-        
-    def draw_export_court(self, ax):
-        line_color = '#2c3e50'
-        line_width = 2.5
-        
-        court = patches.Rectangle((-250, -47.5), 500, 470, 
-                                  linewidth=line_width, edgecolor=line_color, 
-                                  facecolor='none', alpha=0.8)
-        ax.add_patch(court)
-        
-        center_circle = patches.Circle((0, 0), 60, linewidth=line_width, 
-                                       edgecolor=line_color, facecolor='none', alpha=0.8)
-        ax.add_patch(center_circle)
-        
-        three_point_arc = patches.Arc((0, 0), 2*237.5, 2*237.5, 
-                                      theta1=22, theta2=158, linewidth=line_width, 
-                                      edgecolor=line_color, alpha=0.8)
-        ax.add_patch(three_point_arc)
-        
-        ax.plot([-220, -220], [-47.5, 92.5], color=line_color, linewidth=line_width, alpha=0.8)
-        ax.plot([220, 220], [-47.5, 92.5], color=line_color, linewidth=line_width, alpha=0.8)
-        
-        paint = patches.Rectangle((-80, -47.5), 160, 190, 
-                                  linewidth=line_width, edgecolor=line_color, 
-                                  facecolor='none', alpha=0.8)
-        ax.add_patch(paint)
-        
-        ft_semicircle = patches.Arc((0, 142.5), 120, 120,
-                                    theta1=0, theta2=180,
-                                    linewidth=line_width, 
-                                    edgecolor=line_color, facecolor='none', alpha=0.8)
-        ax.add_patch(ft_semicircle)
-        
-        rim = patches.Circle((0, 0), 9, linewidth=line_width, 
-                             edgecolor='#e74c3c', facecolor='#e74c3c', alpha=0.9)
-        ax.add_patch(rim)
+        except Exception:
+            logger.exception("Export error")
+    
+    def on_export_failed(self, error_text):
+        QMessageBox.critical(self, "Export Error", f"Export failed: {error_text}")
         
-        ax.plot([-30, 30], [-7.5, -7.5], color=line_color, linewidth=line_width * 1.2, alpha=0.8)
-
-    def add_export_heatmap(self, ax, shot_data):
-        x = shot_data['x'].values
-        y = shot_data['y'].values
-        made = shot_data['shot_made_flag'].values
-        
-        colors = [
-            '#f8f9fa', '#e3f2fd', '#bbdefb', '#90caf9', '#64b5f6',
-            '#42a5f5', '#2196f3', '#1e88e5', '#1976d2', '#1565c0',
-            '#0d47a1', '#ff8a65', '#ff7043', '#ff5722', '#f4511e'
-        ]
-        cmap_professional = LinearSegmentedColormap.from_list('professional', colors)
-        
-        made_x = x[made == 1]
-        made_y = y[made == 1]
-        
-        if len(made_x) > 5:
-            shot_count = len(made_x)
-            bins = max(30, min(80, shot_count // 8))
-            H_made, xedges, yedges = np.histogram2d(made_x, made_y, 
-                                                    bins=bins,
-                                                    range=[[-250, 250], [-47.5, 422.5]])
-            sigma = max(0.8, min(1.5, shot_count / 400))
-            H_made = ndimage.gaussian_filter(H_made, sigma=sigma)
-            extent = [xedges[0], xedges[-1], yedges[0], yedges[-1]]
-            ax.imshow(H_made.T, extent=extent, origin='lower', 
-                      cmap=cmap_professional, alpha=0.6, aspect='auto',
-                      interpolation='bilinear')
-        
-        dot_size = 8
-        edge_width = 0.5
-        ax.scatter(made_x, made_y, c='#27ae60', s=dot_size, alpha=0.8,
-                   edgecolors='white', linewidth=edge_width, label='Made')
-        missed_x = x[made == 0]
-        missed_y = y[made == 0]
-        ax.scatter(missed_x, missed_y, c='#e74c3c', s=dot_size * 0.8, alpha=0.7,
-                   edgecolors='white', linewidth=edge_width, label='Missed')
-        
-        ax.legend(loc='upper left', bbox_to_anchor=(0.02, 0.98), 
-                  frameon=True, fancybox=True, shadow=True,
-                  facecolor='white', edgecolor='gray', fontsize=10)
-
-    def add_export_zone_labels(self, ax, zones):
-        zone_positions = {
-            'Restricted Area': (0, 70),
-            'In The Paint (Non-RA)': (0, 140),
-            'Mid-Range': (0, 210),
-            'Above the Break 3': (0, 305),
-            'Left Corner 3': (-180, 50),
-            'Right Corner 3': (180, 50),
-        }
-        for zone_name, stats in zones.items():
-            if zone_name in zone_positions:
-                x, y = zone_positions[zone_name]
-                attempts = stats.get('attempted', 0)
-                made = stats.get('made', 0)
-                pct = stats.get('percentage', 0)
-                if attempts >= 3:
-                    label_text = f"{pct:.1f}%\n{made}/{attempts}"
-                    if pct >= 50:
-                        bg_color = '#27ae60'
-                        text_color = 'white'
-                    elif pct >= 40:
-                        bg_color = '#f39c12'
-                        text_color = 'white'
-                    elif pct >= 30:
-                        bg_color = '#e67e22'
-                        text_color = 'white'
-                    else:
-                        bg_color = '#e74c3c'
-                        text_color = 'white'
-                    ax.text(x, y, label_text, fontsize=11, fontweight='bold',
-                            ha='center', va='center', color=text_color,
-                            bbox=dict(boxstyle='round,pad=0.4', facecolor=bg_color,
-                                      edgecolor='white', linewidth=1.5, alpha=0.95))
-                
-    def update_optimized_resolution_court_visualization(self, shot_data: pd.DataFrame, zones: Dict[str, Dict[str, Union[int, float]]]):
+    def update_optimized_resolution_court_visualization(self, shot_data: pd.DataFrame, zones: Dict[str, Dict[str, Union[int, float]]],
+                                                        cache_key=None):
         try:
-            print(f"Creating heatmap for frame ({len(shot_data)} shots)")
+            disk_path = None
+            if cache_key is not None:
+                cached = QPixmapCache.find(cache_key)
+                if cached is not None:
+                    logger.debug("Heatmap served from pixmap cache")
+                    self.update_court_image_optimal(cached)
+                    return False
+                if self._disk_cache_dir is not None:
+                    disk_path = heatmap_disk_path(self._disk_cache_dir, cache_key)
+                    cached = QPixmap(disk_path) if os.path.exists(disk_path) else QPixmap()
+                    if not cached.isNull():
+                        logger.debug("Heatmap served from disk cache")
+                        os.utime(disk_path)  # mark as recently used for pruning
+                        self.update_court_image_optimal(cached, cache_key)
+                        return False
+            logger.debug("Creating heatmap for frame (%s shots)", len(shot_data))
             self.show_loading_message()
             frame_size = self.ui.frame.size()
-            print(f"Frame size: {frame_size.width()}x{frame_size.height()}")
+            logger.debug("Frame size: %sx%s", frame_size.width(), frame_size.height())
             self.viz_thread = Optimal700x550HeatmapGenerator(
-                shot_data, self.current_player, zones, frame_size
+                shot_data, self.current_player, zones, frame_size, cache_path=disk_path
             )
-            self.viz_thread.image_ready.connect(self.update_court_image_optimal)
-            self.viz_thread.start()
-            print("Heatmap generation started")
-        except Exception as e:
-            print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
+            self.viz_thread.signals.image_ready.connect(
+                lambda image, key=cache_key: self.update_court_image_optimal(image, key)
+            )
+            self.viz_thread.signals.render_failed.connect(self.on_render_failed)
+            self.heatmap_pool.start(self.viz_thread)
+            logger.debug("Heatmap generation started")
+            return True
+        except Exception:
+            logger.exception("Error starting heatmap render")
+        return False
         
     def replace_court_image_with_ultra_quality_heatmap(self, shot_data, zones):
-        print("Generating ultra quality heatmap...")
+        logger.debug("Generating ultra quality heatmap...")
         self.show_loading_message()
         frame_size = self.ui.frame.size()
-        print(f"Frame size: {frame_size.width()}x{frame_size.height()}")
+        logger.debug("Frame size: %sx%s", frame_size.width(), frame_size.height())
         self.viz_thread = UltraHighQualityHeatmapGenerator(
             shot_data, self.current_player, zones, frame_size
         )
         self.viz_thread.image_ready.connect(self.update_court_image_ultra_quality)
         self.viz_thread.start()
     
+    def eventFilter(self, obj, event):
+        if obj is self.ui.frame and event.type() == QEvent.Type.Resize:
+            self._frame_label.setGeometry(self.ui.frame.rect())
+            if self._raw_heatmap_pm is not None:
+                self.show_heatmap_pixmap(Qt.TransformationMode.FastTransformation)
+                self._smooth_rescale_timer.start()
+        return super().eventFilter(obj, event)
+    
+    def rescale_heatmap_smooth(self):
+        if self._raw_heatmap_pm is not None:
+            self.show_heatmap_pixmap()
+    
+    def show_frame_text(self, text, style):
+        self._raw_heatmap_pm = None
+        self._frame_label.setStyleSheet(style)
+        self._frame_label.setText(text)
+        self._frame_label.show()
+    
     def show_loading_message(self):
         try:
-            for child in self.ui.frame.findChildren(QLabel):
-                child.deleteLater()
-            loading_label = QLabel("Generating Heatmap...\nPlease wait (~2-3 seconds)...", self.ui.frame)
-            loading_label.setGeometry(0, 0, self.ui.frame.width(), self.ui.frame.height())
-            loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            loading_label.setStyleSheet("""
+            self.show_frame_text("Generating Heatmap...\nPlease wait (~2-3 seconds)...", """
                 color: white; 
                 font-size: 16px; 
                 font-weight: bold; 
@@ -1212,70 +1477,59 @@ class NBAShotAnalyzer(QMainWindow):
                 border-radius: 10px;
                 padding: 20px;
             """)
-            loading_label.show()
-            QApplication.processEvents()
-        except Exception as e:
-            print(f"Error showing loading message: {e}")
+        except Exception:
+            logger.exception("Error showing loading message")
     
-    def update_court_image_optimal(self, image_path):
+    def update_court_image_optimal(self, image, cache_key=None):
         try:
-            print(f"[OPTIMAL] Loading: {image_path}")
-            if not os.path.exists(image_path):
-                self.show_error_message("Heatmap file not found")
-                return
-            
-            pixmap = QPixmap(image_path)
+            pixmap = image if isinstance(image, QPixmap) else QPixmap.fromImage(image)
             if pixmap.isNull():
                 self.show_error_message("Failed to load heatmap")
                 return
+            if cache_key is not None:
+                QPixmapCache.insert(cache_key, pixmap)
             
-            print(f"Loaded: {pixmap.width()}x{pixmap.height()}")
-            print(f"Frame: {self.ui.frame.width()}x{self.ui.frame.height()}")
-            
-            for child in self.ui.frame.findChildren(QLabel):
-                child.deleteLater()
-            QApplication.processEvents()
-            
-            heatmap_label = QLabel(self.ui.frame)
-            heatmap_label.setGeometry(0, 0, self.ui.frame.width(), self.ui.frame.height())
-            
-            scaled_pixmap = pixmap.scaled(
-                self.ui.frame.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            print(f"Scaled to: {scaled_pixmap.width()}x{scaled_pixmap.height()}")
-            heatmap_label.setPixmap(scaled_pixmap)
-            heatmap_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            heatmap_label.show()
-            
-            self.ui.frame.update()
-            QApplication.processEvents()
-            print("[OPTIMAL] Heatmap displayed")
+            logger.debug("Loaded: %sx%s", pixmap.width(), pixmap.height())
+            logger.debug("Frame: %sx%s", self.ui.frame.width(), self.ui.frame.height())
             
-            self.current_heatmap_label = heatmap_label
+            self._raw_heatmap_pm = pixmap
+            self._shown_heatmap_fit = None
+            self.show_heatmap_pixmap()
+            logger.debug("[OPTIMAL] Heatmap displayed")
             
-            try:
-                import time
-                time.sleep(0.1)
-                if os.path.exists(image_path):
-                    os.unlink(image_path)
-            except:
-                pass
-        except Exception as e:
-            print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
+            self.current_heatmap_label = self._frame_label
+        except Exception:
+            logger.exception("Error displaying heatmap")
+        finally:
+            self.finish_calculation()
+    
+    def on_render_failed(self, error_text):
+        self.show_error_message(f"Failed to generate heatmap: {error_text}")
+        self.finish_calculation()
+    
+    def show_heatmap_pixmap(self, mode=Qt.TransformationMode.SmoothTransformation):
+        # The generator renders to the frame size; only rescale if the frame is smaller now
+        pixmap = self._raw_heatmap_pm
+        frame_size = self.ui.frame.size()
+        target_size = pixmap.size()
+        if target_size.width() > frame_size.width() or target_size.height() > frame_size.height():
+            target_size = target_size.scaled(frame_size, Qt.AspectRatioMode.KeepAspectRatio)
+        else:
+            mode = Qt.TransformationMode.SmoothTransformation  # unscaled: already final quality
+        # Resizes that leave the fitted size unchanged (e.g. growing past the render size) are no-ops
+        if (target_size, mode) == self._shown_heatmap_fit:
+            return
+        if target_size != pixmap.size():
+            pixmap = pixmap.scaled(target_size, Qt.AspectRatioMode.IgnoreAspectRatio, mode)
+        self._shown_heatmap_fit = (target_size, mode)
+        self._frame_label.setStyleSheet(HEATMAP_LABEL_STYLE)
+        # setPixmap schedules the repaint; callers return straight to the event loop
+        self._frame_label.setPixmap(pixmap)
+        self._frame_label.show()
 
     def show_error_message(self, error_text):
         try:
-            for child in self.ui.frame.findChildren(QLabel):
-                child.deleteLater()
-            error_label = QLabel(f"{error_text}\n\nTry clicking Calculate again", self.ui.frame)
-            error_label.setGeometry(0, 0, self.ui.frame.width(), self.ui.frame.height())
-            error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            error_label.setStyleSheet("""
+            self.show_frame_text(f"{error_text}\n\nTry clicking Calculate again", """
                 color: #ff6b6b; 
                 font-size: 14px; 
                 font-weight: bold; 
@@ -1284,19 +1538,13 @@ class NBAShotAnalyzer(QMainWindow):
                 padding: 20px;
                 border: 2px solid #ff6b6b;
             """)
-            error_label.show()
-        except Exception as e:
-            print(f"Error showing error message: {e}")
+        except Exception:
+            logger.exception("Error showing error message")
     
     def test_frame_display(self):
         try:
             print("Testing frame display...")
-            for child in self.ui.frame.findChildren(QLabel):
-                child.deleteLater()
-            test_label = QLabel("FRAME TEST\nIf you see this, the frame works!", self.ui.frame)
-            test_label.setGeometry(0, 0, self.ui.frame.width(), self.ui.frame.height())
-            test_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            test_label.setStyleSheet("""
+            self.show_frame_text("FRAME TEST\nIf you see this, the frame works!", """
                 color: #4CAF50; 
                 font-size: 18px; 
                 font-weight: bold; 
@@ -1305,10 +1553,9 @@ class NBAShotAnalyzer(QMainWindow):
                 padding: 20px;
                 border: 2px solid #4CAF50;
             """)
-            test_label.show()
             print("Test frame display complete")
-        except Exception as e:
-            print(f"Frame test error: {e}")
+        except Exception:
+            logger.exception("Frame test error")
     
     def on_export_or_reset(self):
         if self.shot_data is not None and not self.shot_data.empty:
@@ -1325,21 +1572,18 @@ class NBAShotAnalyzer(QMainWindow):
                 QMessageBox.warning(self, "No Data", "No analysis data available for export")
                 return
             
-            print("Preparing high resolution export...")
+            logger.debug("Preparing high resolution export...")
             filters = self.get_current_filters()
-            filtered_data = self.filter_engine.apply_all_filters(
-                self.current_player, self.current_team, filters
-            )
+            filtered_data, zones = self.filtered_shots(filters)
             if filtered_data.empty:
                 QMessageBox.warning(self, "No Data", "No shots match current filters")
                 return
-            zones = self.zone_calculator.calculate_zones(filtered_data)
-            self.show_export_dialog(filtered_data, zones)
+            self.show_export_dialog(filtered_data, zones, filters)
         except Exception as e:
-            print(f"Export preparation error: {e}")
+            logger.exception("Export preparation error")
             QMessageBox.critical(self, "Export Error", f"Failed to prepare export: {str(e)}")
     
-    def show_export_dialog(self, shot_data, zones):
+    def show_export_dialog(self, shot_data, zones, filters):
         try:
             dialog = QDialog(self)
             dialog.setWindowTitle("Export High-Resolution Heatmap")
@@ -1362,7 +1606,7 @@ class NBAShotAnalyzer(QMainWindow):
             quality_layout.addWidget(quality_combo)
             layout.addLayout(quality_layout)
             
-            info = QLabel(f"Player: {self.current_player}\nShots: {len(shot_data)}\nFilters: {sum(1 for v in self.get_current_filters().values() if v != 'All')} active")
+            info = QLabel(f"Player: {self.current_player}\nShots: {len(shot_data)}\nFilters: {sum(1 for v in filters.values() if v != 'All')} active")
             info.setStyleSheet("margin: 10px 0px; padding: 10px; background-color: rgba(0,0,0,0.1); border-radius: 5px;")
             layout.addWidget(info)
             
@@ -1378,8 +1622,8 @@ class NBAShotAnalyzer(QMainWindow):
             
             dialog.setLayout(layout)
             dialog.exec()
-        except Exception as e:
-            print(f"Export dialog error: {e}")
+        except Exception:
+            logger.exception("Export dialog error")
     
     def do_export(self, dialog, quality_index, shot_data, zones):
         try:
@@ -1396,114 +1640,17 @@ class NBAShotAnalyzer(QMainWindow):
                 "PNG files (*.png);;All files (*.*)"
             )
             if file_path:
+                # A bare name would be saved with .png appended; add it here so export_done
+                # reports (and on_export_done stats) the file actually written
+                if not os.path.splitext(file_path)[1]:
+                    file_path += '.png'
                 dialog.accept()
                 self.show_status(f"Exporting {quality['name']} quality heatmap...")
                 self.create_export_using_display_method(file_path, shot_data, zones, quality)
         except Exception as e:
-            print(f"Export execution error: {e}")
+            logger.exception("Export execution error")
             QMessageBox.critical(dialog, "Export Error", f"Export failed: {str(e)}")
     
-    def create_professional_export(self, file_path, shot_data, zones, quality):
-        try:
-            import matplotlib
-            matplotlib.use('Agg')
-            
-            print(f"Creating high-resolution {quality['name']} export...")
-            fig_width, fig_height = 16, 12
-            fig, ax = plt.subplots(figsize=(fig_width, fig_height), dpi=quality['dpi'])
-            fig.patch.set_facecolor('#1a1a1a')
-            ax.set_facecolor('#0a1929')
-            plt.subplots_adjust(left=0.02, right=0.98, top=0.92, bottom=0.08)
-            
-            line_width = max(3, quality['dpi'] / 100)
-            line_color = '#ffffff'
-            
-            court = patches.Rectangle((-250, -47.5), 500, 470, 
-                                      linewidth=line_width, edgecolor=line_color, 
-                                      facecolor='none', alpha=0.9)
-            ax.add_patch(court)
-            center_circle = patches.Circle((0, 0), 60, linewidth=line_width, 
-                                           edgecolor=line_color, facecolor='none', alpha=0.9)
-            ax.add_patch(center_circle)
-            three_point_arc = patches.Arc((0, 0), 2*237.5, 2*237.5, 
-                                          theta1=22, theta2=158, linewidth=line_width, 
-                                          edgecolor=line_color, alpha=0.9)
-            ax.add_patch(three_point_arc)
-            ax.plot([-220, -220], [-47.5, 92.5], color=line_color, linewidth=line_width, alpha=0.9)
-            ax.plot([220, 220], [-47.5, 92.5], color=line_color, linewidth=line_width, alpha=0.9)
-            paint = patches.Rectangle((-80, -47.5), 160, 190, 
-                                      linewidth=line_width, edgecolor=line_color, 
-                                      facecolor='none', alpha=0.9)
-            ax.add_patch(paint)
-            ft_semicircle = patches.Arc((0, 142.5), 120, 120, theta1=0, theta2=180,
-                                        linewidth=line_width, edgecolor=line_color, 
-                                        facecolor='none', alpha=0.9)
-            ax.add_patch(ft_semicircle)
-            rim = patches.Circle((0, 0), max(8, quality['dpi']/40), linewidth=line_width, 
-                                 edgecolor='#ff6b35', facecolor='#ff6b35', alpha=1.0)
-            ax.add_patch(rim)
-            ax.plot([-30, 30], [-7.5, -7.5], color=line_color, linewidth=line_width*1.5, alpha=0.9)
-            
-            if not shot_data.empty:
-                x, y = shot_data['x'].values, shot_data['y'].values
-                made = shot_data['shot_made_flag'].values
-                made_x, made_y = x[made == 1], y[made == 1]
-                if len(made_x) > 0:
-                    colors_hot = ['#001122', '#003366', '#0066aa', '#0099ee', '#33ccff', 
-                                  '#66ffcc', '#ccff66', '#ffcc33', '#ff9900', '#ff4400', '#cc0000']
-                    cmap_hot = LinearSegmentedColormap.from_list('export_hot', colors_hot)
-                    bins = max(50, min(100, quality['dpi'] // 5))
-                    H_made, xedges, yedges = np.histogram2d(made_x, made_y, bins=bins,
-                                                            range=[[-250, 250], [-47.5, 422.5]])
-                    H_made = ndimage.gaussian_filter(H_made, sigma=quality['dpi']/200)
-                    extent = [xedges[0], xedges[-1], yedges[0], yedges[-1]]
-                    ax.imshow(H_made.T, extent=extent, origin='lower', 
-                              cmap=cmap_hot, alpha=0.75, aspect='auto', interpolation='bilinear')
-                dot_size = max(10, quality['dpi'] / 30)
-                edge_width = max(1, quality['dpi'] / 300)
-                ax.scatter(made_x, made_y, c='#00FF7F', s=dot_size, alpha=0.9,
-                           edgecolors='white', linewidth=edge_width)
-                ax.scatter(x[made == 0], y[made == 0], c='#FF4444', s=dot_size*0.85, alpha=0.8,
-                           edgecolors='white', linewidth=edge_width)
-            
-            if zones:
-                zone_positions = {
-                    'Restricted Area': (0, 70), 'In The Paint (Non-RA)': (0, 140),
-                    'Mid-Range': (0, 210), 'Above the Break 3': (0, 305),
-                    'Left Corner 3': (-180, 50), 'Right Corner 3': (180, 50)
-                }
-                font_size = max(12, quality['dpi'] / 25)
-                for zone_name, stats in zones.items():
-                    if zone_name in zone_positions and stats.get('attempted', 0) > 0:
-                        x, y = zone_positions[zone_name]
-                        pct = stats.get('percentage', 0)
-                        if pct >= 50: bg_color = '#00C853'
-                        elif pct >= 40: bg_color = '#FFB300'  
-                        elif pct >= 30: bg_color = '#FF8F00'
-                        else: bg_color = '#D32F2F'
-                        ax.text(x, y, f"{pct:.1f}%\n{stats['made']}/{stats['attempted']}", 
-                                fontsize=font_size, fontweight='bold', ha='center', va='center', 
-                                color='white', bbox=dict(boxstyle='round,pad=0.5', facecolor=bg_color,
-                                                         edgecolor='white', linewidth=2, alpha=0.95))
-            
-            ax.set_xlim(-260, 260)
-            ax.set_ylim(-50, 430)
-            ax.set_aspect('equal')
-            ax.axis('off')
-            plt.title(f'{self.current_player} - {self.current_season} Shot Analysis', 
-                      color='white', fontsize=max(18, quality['dpi']/20), fontweight='bold', pad=20)
-            plt.savefig(file_path, dpi=quality['dpi'], bbox_inches='tight', 
-                        facecolor='#1a1a1a', edgecolor='none', pad_inches=0.1)
-            plt.close()
-            file_size = os.path.getsize(file_path) / (1024*1024)
-            QMessageBox.information(self, "Export Complete", 
-                                    f"High-res heatmap exported!\n\n"
-                                    f"Size: {file_size:.1f} MB\n"
-                                    f"Quality: {quality['name']} ({quality['dpi']} DPI)")
-        except Exception as e:
-            print(f"Export error: {e}")
-            QMessageBox.critical(self, "Export Error", f"Export failed: {str(e)}")
-    
     def debug_shot_data_structure(self):
         if self.shot_data is None or self.shot_data.empty:
             print("No shot data loaded")
@@ -1561,13 +1708,20 @@ class NBAShotAnalyzer(QMainWindow):
         print("Using dummy NBA zone data for testing.")
         for zone, stats in dummy_zones.items():
             print(f"   {zone}: {stats}")
+        # Seeded so the dummy render is identical every time and can be served from the pixmap cache
+        rng = np.random.default_rng(0)
+        xy = rng.uniform([-250, -47.5], [250, 422.5], size=(1000, 2))
         dummy_data = pd.DataFrame({
-            'x': np.random.uniform(-250, 250, 1000),
-            'y': np.random.uniform(-47.5, 422.5, 1000),
-            'shot_made_flag': np.random.choice([0, 1], 1000),
-            'shot_zone_basic': np.random.choice(list(dummy_zones.keys()), 1000)
+            'x': xy[:, 0],
+            'y': xy[:, 1],
+            'shot_made_flag': rng.integers(0, 2, 1000),
+            'shot_zone_basic': rng.choice(list(dummy_zones.keys()), 1000)
         })
-        self.update_optimized_resolution_court_visualization(dummy_data, dummy_zones)
+        size = self.ui.frame.size()
+        self.update_optimized_resolution_court_visualization(
+            dummy_data, dummy_zones,
+            f"force_test|{self.current_player}|{size.width()}x{size.height()}"
+        )
         print("Dummy zones applied to heatmap")
     
     def debug_current_state(self):
@@ -1586,29 +1740,33 @@ class NBAShotAnalyzer(QMainWindow):
             print(f"UI Season: {season_text}")
             print(f"UI Team: {team_text}")
             print(f"UI Player: {player_text}")
-        except Exception as e:
-            print(f"Error getting UI selections: {e}")
+        except Exception:
+            logger.exception("Error getting UI selections")
         print("=" * 50)
     
     def show_status(self, message: str):
-        print(f"STATUS: {message}")
+        logger.debug("STATUS: %s", message)
         try:
             self.ui.statusbar.showMessage(message, 5000)
         except AttributeError:
-            print("Status bar not found")
+            logger.warning("Status bar not found")
     
     def closeEvent(self, event):
         try:
             print("Application closing...")
-            if hasattr(self, 'viz_thread') and self.viz_thread.isRunning():
-                self.viz_thread.quit()
-                self.viz_thread.wait()
+            self.loader_pool.clear()
+            self.heatmap_pool.clear()
+            self.loader_pool.waitForDone()
+            self.heatmap_pool.waitForDone()
             event.accept()
-        except Exception as e:
-            print(f"Error during cleanup: {e}")
+        except Exception:
+            logger.exception("Error during cleanup")
             event.accept()
 
 def main():
+    # Trace output is opt-in: NBA_SHOT_ANALYZER_DEBUG=1 shows the per-action messages
+    logging.basicConfig(format='%(message)s',
+                        level=logging.DEBUG if os.environ.get('NBA_SHOT_ANALYZER_DEBUG') else logging.INFO)
     print("Starting NBA Shot Analyzer...")
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
@@ -1617,9 +1775,7 @@ def main():
         window.show()
         sys.exit(app.exec())
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unhandled error in NBA Shot Analyzer")
         QMessageBox.critical(None, "Error", str(e))
         sys.exit(1)
 